@@ -469,6 +469,50 @@ def build_ir(model: dict) -> dict:
     return ir
 
 
+def _filter_mask(df, filter_specs: list, filter_values: dict):
+    """
+    Combine all active page filters into one boolean row mask
+
+    Each predicate is evaluated once against the unfiltered frame and AND-ed
+    into the mask, so the frame is only subset (and copied) a single time.
+
+    Args:
+        df: Source dataframe
+        filter_specs: Page filter specifications
+        filter_values: Runtime filter values keyed by filter id
+
+    Returns:
+        Boolean numpy array, or None if no filter applies
+    """
+    mask = None
+
+    for filter_spec in filter_specs:
+        filter_id = filter_spec["id"]
+        if filter_id not in filter_values:
+            continue
+
+        filter_value = filter_values[filter_id]
+        column = df[filter_spec["field"]]
+
+        # Build predicate based on filter type
+        if filter_spec["type"] == "range":
+            if not (isinstance(filter_value, (list, tuple)) and len(filter_value) == 2):
+                continue
+            condition = (column >= filter_value[0]) & (column <= filter_value[1])
+        elif filter_spec["type"] in ["select", "multiselect"]:
+            if isinstance(filter_value, list):
+                condition = column.isin(filter_value)
+            else:
+                condition = column == filter_value
+        else:
+            continue
+
+        condition = condition.to_numpy(dtype=bool, na_value=False)
+        mask = condition if mask is None else mask & condition
+
+    return mask
+
+
 def execute(ir: dict, inputs: dict) -> dict:
     """
     Execute the dashboard specification
@@ -575,26 +619,9 @@ def execute(ir: dict, inputs: dict) -> dict:
             "data": df,  # Store reference to filtered data
         }
 
-        # Apply filters from inputs
-        filtered_df = df.copy()
-        for filter_spec in page_ir["filters"]:
-            filter_id = filter_spec["id"]
-            if filter_id in inputs.get("filters", {}):
-                filter_value = inputs["filters"][filter_id]
-                field = filter_spec["field"]
-
-                # Apply filter based on type
-                if filter_spec["type"] == "range":
-                    if isinstance(filter_value, (list, tuple)) and len(filter_value) == 2:
-                        filtered_df = filtered_df[
-                            (filtered_df[field] >= filter_value[0])
-                            & (filtered_df[field] <= filter_value[1])
-                        ]
-                elif filter_spec["type"] in ["select", "multiselect"]:
-                    if isinstance(filter_value, list):
-                        filtered_df = filtered_df[filtered_df[field].isin(filter_value)]
-                    else:
-                        filtered_df = filtered_df[filtered_df[field] == filter_value]
+        # Apply filters from inputs as a single combined mask
+        mask = _filter_mask(df, page_ir["filters"], inputs.get("filters", {}))
+        filtered_df = df[mask] if mask is not None else df.copy()
 
         page_result["data"] = filtered_df
 
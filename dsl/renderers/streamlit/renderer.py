@@ -15,12 +15,18 @@ Generated renderers are in dsl/viz_renderers.py
 DO NOT modify viz_renderers.py - regenerate from DSL spec instead
 """
 
+import hashlib
+from datetime import date
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import streamlit as st
 
 from dsl.core.adapter import parse, build_ir, execute, validate
@@ -39,6 +45,172 @@ except ImportError:
     CUSTOM_VALIDATORS = []
 
 
+# Grid layout widths, in twelfths of the page width
+GRID_COLUMNS = 12
+GRID_WIDTHS = {"full": 12, "half": 6, "third": 4}
+
+
+def _canonical_scalar(value: Any) -> Any:
+    """Convert a filter value to a plain, hashable Python scalar"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, date):
+        # Covers datetime.date, datetime.datetime and pd.Timestamp
+        return value.isoformat()
+    return value
+
+
+def _canonical(filters: Dict[str, Any]) -> tuple:
+    """
+    Build a stable, cheaply hashable key from filter widget values
+
+    Numpy scalars are unwrapped, dates are ISO-formatted and lists become tuples,
+    so equal selections always map to the same key.
+    """
+    items = []
+    for key in sorted(filters):
+        value = filters[key]
+        if isinstance(value, (list, tuple)):
+            value = tuple(_canonical_scalar(v) for v in value)
+        else:
+            value = _canonical_scalar(value)
+        items.append((key, value))
+    return tuple(items)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _filter_options(data_path: str, mtime_ns: int, field: str) -> list:
+    """
+    Sorted distinct values of a single parquet column, for select filters
+
+    Only ``field`` is read from the file. Dictionary-encoded columns (categoricals,
+    low-cardinality strings) dedupe their integer indices and look those up in the
+    dictionary, so unused categories are not offered. ``mtime_ns`` invalidates the
+    cache when the file is rewritten.
+    """
+    column = pq.read_table(data_path, columns=[field]).column(field)
+
+    if pa.types.is_dictionary(column.type):
+        values = pa.chunked_array(
+            [chunk.dictionary.take(pc.unique(chunk.indices)) for chunk in column.chunks],
+            type=column.type.value_type,
+        )
+    else:
+        values = column
+
+    uniques = pc.drop_null(pc.unique(values))
+    return sorted(uniques.to_pylist())
+
+
+def _frame_key(df: pd.DataFrame) -> str:
+    """Order-sensitive content hash of a dataframe, used as a figure cache key"""
+    row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    digest = hashlib.sha1(row_hashes.tobytes())
+    digest.update(repr(tuple(df.columns)).encode())
+    return digest.hexdigest()
+
+
+# ===== Legacy (v1.0) figure builders =====
+# Each builder takes (df, (x_field, y_field, color_field, size_field)) and returns
+# a Plotly figure, or None if the chart's required fields are missing.
+
+
+def _build_line(df: pd.DataFrame, fields: tuple) -> Optional[go.Figure]:
+    x_field, y_field, color_field, _ = fields
+    return px.line(df, x=x_field, y=y_field, color=color_field)
+
+
+def _build_bar(df: pd.DataFrame, fields: tuple) -> Optional[go.Figure]:
+    x_field, y_field, color_field, _ = fields
+    return px.bar(df, x=x_field, y=y_field, color=color_field)
+
+
+def _build_scatter(df: pd.DataFrame, fields: tuple) -> Optional[go.Figure]:
+    x_field, y_field, color_field, size_field = fields
+    return px.scatter(df, x=x_field, y=y_field, color=color_field, size=size_field)
+
+
+def _build_histogram(df: pd.DataFrame, fields: tuple) -> Optional[go.Figure]:
+    x_field, _, color_field, _ = fields
+    return px.histogram(df, x=x_field, color=color_field)
+
+
+def _build_box(df: pd.DataFrame, fields: tuple) -> Optional[go.Figure]:
+    x_field, y_field, color_field, _ = fields
+    return px.box(df, x=x_field, y=y_field, color=color_field)
+
+
+def _build_pie(df: pd.DataFrame, fields: tuple) -> Optional[go.Figure]:
+    # Group data for pie chart
+    x_field = fields[0]
+    if not x_field:
+        return None
+    pie_data = df[x_field].value_counts().reset_index()
+    pie_data.columns = ["category", "count"]
+    return px.pie(pie_data, names="category", values="count")
+
+
+def _build_heatmap(df: pd.DataFrame, fields: tuple) -> Optional[go.Figure]:
+    # Create pivot table for heatmap
+    x_field, y_field, color_field, _ = fields
+    if not (x_field and y_field and color_field):
+        return None
+    pivot = df.pivot_table(values=color_field, index=y_field, columns=x_field, aggfunc="mean")
+    return px.imshow(pivot)
+
+
+_LEGACY_BUILDERS: Dict[str, Callable[[pd.DataFrame, tuple], Optional[go.Figure]]] = {
+    "line": _build_line,
+    "bar": _build_bar,
+    "scatter": _build_scatter,
+    "histogram": _build_histogram,
+    "box": _build_box,
+    "pie": _build_pie,
+    "heatmap": _build_heatmap,
+}
+
+
+def _build_legacy_figure(chart_type: str, fields: tuple, df: pd.DataFrame) -> Optional[dict]:
+    """
+    Build a legacy Plotly figure and return it as a plain dict
+
+    Args:
+        chart_type: Legacy chart type (key of _LEGACY_BUILDERS)
+        fields: (x_field, y_field, color_field, size_field)
+        df: Data to plot
+
+    Returns:
+        Figure dict, or None if the chart's required fields are missing
+    """
+    fig = _LEGACY_BUILDERS[chart_type](df, fields)
+    return fig.to_dict() if fig is not None else None
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _build_legacy_figure_cached(
+    chart_type: str, df_key: str, fields: tuple, _df: pd.DataFrame
+) -> Optional[dict]:
+    """Cached figure build - ``_df`` is skipped by Streamlit's hasher, ``df_key`` identifies it"""
+    return _build_legacy_figure(chart_type, fields, _df)
+
+
+def _legacy_figure_dict(chart_type: str, viz: Dict[str, Any], df: pd.DataFrame) -> Optional[dict]:
+    """Build (or fetch from cache) the figure dict for a legacy visualization"""
+    fields = (
+        viz.get("x_field"),
+        viz.get("y_field"),
+        viz.get("color_field"),
+        viz.get("size_field"),
+    )
+    try:
+        df_key = _frame_key(df)
+    except TypeError:
+        # Unhashable cell values (lists, dicts) - build without caching
+        return _build_legacy_figure(chart_type, fields, df)
+
+    return _build_legacy_figure_cached(chart_type, df_key, fields, df)
+
+
 class StreamlitRenderer:
     """Renders DashSpec specifications in Streamlit"""
 
@@ -51,27 +223,31 @@ class StreamlitRenderer:
     DSL_VERSION = "1.3.0"
     SUPPORTED_VERSIONS = ["1.0", "1.1", "1.2", "1.3"]
 
-    def __init__(self, spec_path: str, use_tabs: bool = False):
+    def __init__(
+        self, spec_path: str, use_tabs: bool = False, spec: Optional[Dict[str, Any]] = None
+    ):
         """
         Initialize renderer with a dashboard specification
 
         Args:
             spec_path: Path to the YAML dashboard specification file
             use_tabs: If True, use tabs for page navigation instead of sidebar selectbox
+            spec: Already-parsed specification; when given, spec_path is not re-read
         """
         self.spec_path = Path(spec_path)
-        self.spec = None
+        self.spec = spec
         self.ir = None
         self.use_tabs = use_tabs
+        self._results_cache: Dict[tuple, Dict[str, Any]] = {}
         self.load_spec()
 
     def load_spec(self):
         """Load and validate the dashboard specification"""
-        with open(self.spec_path) as f:
-            spec_yaml = f.read()
-
-        # Parse
-        self.spec = parse(spec_yaml)
+        # Parse, unless an already-parsed spec was supplied
+        if self.spec is None:
+            with open(self.spec_path) as f:
+                spec_yaml = f.read()
+            self.spec = parse(spec_yaml)
 
         # Validate
         violations = validate(self.spec)
@@ -153,7 +329,7 @@ class StreamlitRenderer:
         # Execute with filter values (with graceful error handling)
         inputs = {"filters": filter_values}
         try:
-            results = execute(self.ir, inputs)
+            results = self._execute_cached(inputs)
             page_results = results["pages"][page_idx]
         except Exception as e:
             st.error("❌ Dashboard Execution Failed")
@@ -213,6 +389,26 @@ class StreamlitRenderer:
         if page.get("layout"):
             self.render_layout(page["layout"], page_results)
 
+    def _execute_cached(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute the IR, reusing results for identical filter selections
+
+        execute() computes every page at once, so pages (and tabs) that share
+        the same filter values can reuse a single execution.
+
+        Args:
+            inputs: Runtime inputs with a "filters" dict
+
+        Returns:
+            Execution results from execute()
+        """
+        key = _canonical(inputs.get("filters", {}))
+        results = self._results_cache.get(key)
+        if results is None:
+            results = execute(self.ir, inputs)
+            self._results_cache[key] = results
+        return results
+
     def render_filter(self, filter_spec: Dict[str, Any]) -> Any:
         """
         Render a filter widget
@@ -227,11 +423,22 @@ class StreamlitRenderer:
         filter_type = filter_spec["type"]
         default = filter_spec.get("default")
 
-        # Load data to get filter options
         data_path = self.spec["dashboard"]["data_source"]["path"]
-        df = pd.read_parquet(data_path)
         field = filter_spec["field"]
 
+        if filter_type in ("select", "multiselect"):
+            options = _filter_options(data_path, Path(data_path).stat().st_mtime_ns, field)
+
+            if filter_type == "select":
+                default_val = default if default in options else options[0]
+                return st.selectbox(label, options, index=options.index(default_val))
+
+            default_vals = default if default else []
+            return st.multiselect(label, options, default=default_vals)
+
+        # Load only the filtered column to get value bounds
+        df = pd.read_parquet(data_path, columns=[field])
+
         if filter_type == "range":
             min_val = float(df[field].min())
             max_val = float(df[field].max())
@@ -252,16 +459,6 @@ class StreamlitRenderer:
             step = range_size / 1000.0 if range_size > 0 else 0.01
             return st.slider(label, min_val, max_val, default_val, step=step)
 
-        elif filter_type == "select":
-            options = sorted(df[field].unique())
-            default_val = default if default in options else options[0]
-            return st.selectbox(label, options, index=options.index(default_val))
-
-        elif filter_type == "multiselect":
-            options = sorted(df[field].unique())
-            default_vals = default if default else []
-            return st.multiselect(label, options, default=default_vals)
-
         elif filter_type == "date_range":
             min_date = pd.to_datetime(df[field]).min()
             max_date = pd.to_datetime(df[field]).max()
@@ -338,21 +535,20 @@ class StreamlitRenderer:
                 self.render_component(component, page_results)
 
         elif layout_type == "grid":
-            # Group components by width
-            for component in components:
-                width = component.get("width", "full")
-
-                if width == "full":
-                    self.render_component(component, page_results)
-                elif width == "half":
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        self.render_component(component, page_results)
-                elif width == "third":
-                    cols = st.columns(3)
-                    # Find position
-                    idx = components.index(component)
-                    with cols[idx % 3]:
+            for row in self._pack_grid_rows(components):
+                if len(row) == 1 and row[0][1] == GRID_COLUMNS:
+                    self.render_component(row[0][0], page_results)
+                    continue
+
+                widths = [width for _, width in row]
+                spare = GRID_COLUMNS - sum(widths)
+                if spare:
+                    # Keep partial rows left-aligned at their declared widths
+                    widths.append(spare)
+
+                cols = st.columns(widths)
+                for (component, _), col in zip(row, cols):
+                    with col:
                         self.render_component(component, page_results)
 
         elif layout_type == "tabs":
@@ -363,6 +559,33 @@ class StreamlitRenderer:
                 with tab:
                     self.render_component(component, page_results)
 
+    @staticmethod
+    def _pack_grid_rows(components: List[Dict[str, Any]]) -> List[List[Tuple[Dict[str, Any], int]]]:
+        """
+        Pack grid components into rows of at most GRID_COLUMNS width units
+
+        Args:
+            components: Layout components in display order
+
+        Returns:
+            Rows of (component, width) pairs
+        """
+        rows = []
+        row, remaining = [], GRID_COLUMNS
+
+        for component in components:
+            width = GRID_WIDTHS.get(component.get("width", "full"), GRID_COLUMNS)
+            if width > remaining:
+                rows.append(row)
+                row, remaining = [], GRID_COLUMNS
+            row.append((component, width))
+            remaining -= width
+
+        if row:
+            rows.append(row)
+
+        return rows
+
     def render_component(self, component: Dict[str, Any], page_results: Dict[str, Any]):
         """
         Render a single component
@@ -467,63 +690,14 @@ class StreamlitRenderer:
                 return
 
         # Priority 3: Legacy renderers (for backward compatibility with v1.0)
-        if chart_type == "line":
-            fig = px.line(
-                df, x=viz.get("x_field"), y=viz.get("y_field"), color=viz.get("color_field")
-            )
-            st.plotly_chart(fig)
-
-        elif chart_type == "bar":
-            fig = px.bar(
-                df, x=viz.get("x_field"), y=viz.get("y_field"), color=viz.get("color_field")
-            )
-            st.plotly_chart(fig)
-
-        elif chart_type == "scatter":
-            fig = px.scatter(
-                df,
-                x=viz.get("x_field"),
-                y=viz.get("y_field"),
-                color=viz.get("color_field"),
-                size=viz.get("size_field"),
-            )
-            st.plotly_chart(fig)
-
-        elif chart_type == "histogram":
-            fig = px.histogram(df, x=viz.get("x_field"), color=viz.get("color_field"))
-            st.plotly_chart(fig)
-
-        elif chart_type == "box":
-            fig = px.box(
-                df, x=viz.get("x_field"), y=viz.get("y_field"), color=viz.get("color_field")
-            )
-            st.plotly_chart(fig)
-
-        elif chart_type == "pie":
-            # Group data for pie chart
-            x_field = viz.get("x_field")
-            if x_field:
-                pie_data = df[x_field].value_counts().reset_index()
-                pie_data.columns = ["category", "count"]
-                fig = px.pie(pie_data, names="category", values="count")
-                st.plotly_chart(fig)
+        if chart_type in _LEGACY_BUILDERS:
+            fig_dict = _legacy_figure_dict(chart_type, viz, df)
+            if fig_dict is not None:
+                st.plotly_chart(go.Figure(fig_dict), use_container_width=True, theme=None)
 
         elif chart_type == "table":
             st.dataframe(df)
 
-        elif chart_type == "heatmap":
-            # Create pivot table for heatmap
-            x_field = viz.get("x_field")
-            y_field = viz.get("y_field")
-            color_field = viz.get("color_field")
-
-            if x_field and y_field and color_field:
-                pivot = df.pivot_table(
-                    values=color_field, index=y_field, columns=x_field, aggfunc="mean"
-                )
-                fig = px.imshow(pivot)
-                st.plotly_chart(fig)
-
         else:
             # Chart type not found in any renderer
             st.error(f"Unknown chart type: '{chart_type}'")
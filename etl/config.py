@@ -45,7 +45,8 @@ class ETLConfig(BaseModel):
     # Processing options
     max_workers: int = 2
     chunk_size: int = 10000
-    compression: str = "snappy"
+    compression: str = "zstd"
+    compression_level: Optional[int] = 3
 
 
 def load_config(config_path: str = "config/datasets.yaml") -> ETLConfig:
@@ -4,24 +4,88 @@ Data loading module - handles saving to Parquet format
 
 import json
 import logging
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional, Tuple
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# orjson handles NumPy scalars leaking out of to_dict() natively
+ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson else 0
+)
+
+# Rows per Parquet row group; bounds writer memory to one group at a time
+ROW_GROUP_SIZE = 131_072
+DATA_PAGE_SIZE = 1 << 20
+
 
 class ParquetLoader:
     """Handles loading transformed data to Parquet files"""
 
-    def __init__(self, processed_data_dir: Path, metadata_dir: Path, compression: str = "snappy"):
+    def __init__(
+        self,
+        processed_data_dir: Path,
+        metadata_dir: Path,
+        compression: str = "zstd",
+        compression_level: Optional[int] = 3,
+    ):
         self.processed_data_dir = processed_data_dir
         self.metadata_dir = metadata_dir
         self.compression = compression
+        self.compression_level = compression_level
+
+        # dataset_name -> (path, is_file, size) for outputs known to exist
+        self._path_cache: Dict[str, Tuple[Path, bool, Optional[int]]] = {}
+
+    def resolve(self, dataset_name: str) -> Optional[Tuple[Path, bool, Optional[int]]]:
+        """
+        Locate the Parquet output for a dataset with one stat per candidate path
+
+        Args:
+            dataset_name: Name of the dataset
+
+        Returns:
+            Tuple of (path, is_file, size in bytes or None for a partitioned directory),
+            or None if neither a Parquet file nor a partitioned directory exists
+        """
+        cached = self._path_cache.get(dataset_name)
+        if cached is not None:
+            return cached
+
+        for path in (
+            self.processed_data_dir / f"{dataset_name}.parquet",
+            self.processed_data_dir / dataset_name,
+        ):
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+
+            is_file = stat.S_ISREG(st.st_mode)
+            resolved = (path, is_file, st.st_size if is_file else None)
+            self._path_cache[dataset_name] = resolved
+            return resolved
+
+        return None
 
     def save_to_parquet(
-        self, df: pd.DataFrame, dataset_name: str, partition_cols: Optional[list] = None
+        self,
+        df: pd.DataFrame,
+        dataset_name: str,
+        partition_cols: Optional[list] = None,
+        file_metadata: Optional[Dict[str, str]] = None,
     ) -> Path:
         """
         Save dataframe to Parquet format
@@ -30,6 +94,7 @@ class ParquetLoader:
             df: Dataframe to save
             dataset_name: Name of the dataset
             partition_cols: Optional columns to partition by
+            file_metadata: Optional key-value metadata stored in the Parquet footer
 
         Returns:
             Path to the saved Parquet file
@@ -38,26 +103,40 @@ class ParquetLoader:
 
         logger.info(f"Saving {dataset_name} to Parquet format")
         logger.info(f"Output path: {output_path}")
-        logger.info(f"Compression: {self.compression}")
+        logger.info(f"Compression: {self.compression} (level {self.compression_level})")
+
+        self._path_cache.pop(dataset_name, None)
 
         try:
             if partition_cols and all(col in df.columns for col in partition_cols):
                 # Save with partitioning
                 output_dir = self.processed_data_dir / dataset_name
-                df.to_parquet(
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                table = table.replace_schema_metadata(
+                    self._merge_metadata(table.schema, file_metadata)
+                )
+                pq.write_to_dataset(
+                    table,
                     output_dir,
-                    engine="pyarrow",
-                    compression=self.compression,
                     partition_cols=partition_cols,
-                    index=False,
+                    row_group_size=ROW_GROUP_SIZE,
+                    **self._write_options(table.schema),
                 )
                 logger.info(f"Saved partitioned Parquet to {output_dir}")
                 return output_dir
             else:
-                # Save as single file
-                df.to_parquet(
-                    output_path, engine="pyarrow", compression=self.compression, index=False
-                )
+                # Save as single file, one row group per batch
+                schema = pa.Schema.from_pandas(df, preserve_index=False)
+                schema = schema.with_metadata(self._merge_metadata(schema, file_metadata))
+                with pq.ParquetWriter(
+                    output_path,
+                    schema,
+                    data_page_size=DATA_PAGE_SIZE,
+                    write_statistics=True,
+                    **self._write_options(schema),
+                ) as writer:
+                    for batch in self._record_batches(df, schema):
+                        writer.write_batch(batch)
                 logger.info(f"Saved Parquet file: {output_path}")
                 return output_path
 
@@ -65,6 +144,95 @@ class ParquetLoader:
             logger.error(f"Failed to save Parquet file for {dataset_name}: {e}")
             raise
 
+    @staticmethod
+    def _merge_metadata(schema: pa.Schema, file_metadata: Optional[Dict[str, str]]) -> Dict:
+        """Add file-level key-value metadata to the schema's existing (pandas) metadata"""
+        merged = dict(schema.metadata or {})
+        for key, value in (file_metadata or {}).items():
+            merged[key.encode()] = str(value).encode()
+        return merged
+
+    def _write_options(self, schema: pa.Schema) -> Dict:
+        """
+        Compression and encoding options for a Parquet write
+
+        Float columns use byte-stream-split encoding, which groups the bytes of each
+        value so the compressor sees runs of similar exponent/mantissa bytes; every
+        other column is dictionary encoded.
+
+        Args:
+            schema: Arrow schema of the data being written
+
+        Returns:
+            Keyword arguments for ParquetWriter / write_to_dataset
+        """
+        float_cols = [field.name for field in schema if pa.types.is_floating(field.type)]
+        other_cols = [field.name for field in schema if field.name not in float_cols]
+
+        try:
+            supports_level = pa.Codec.supports_compression_level(self.compression)
+        except ValueError:
+            # "none" / unknown codecs
+            supports_level = False
+
+        return {
+            "compression": self.compression,
+            "compression_level": self.compression_level if supports_level else None,
+            "use_dictionary": other_cols,
+            "use_byte_stream_split": float_cols,
+        }
+
+    @staticmethod
+    def _record_batches(df: pd.DataFrame, schema: pa.Schema) -> Iterator[pa.RecordBatch]:
+        """
+        Convert a dataframe to record batches one row group at a time
+
+        The next slice is converted on a background thread while the caller encodes,
+        compresses and writes the current one.
+
+        Args:
+            df: Dataframe to convert
+            schema: Arrow schema inferred from the whole dataframe
+
+        Yields:
+            Record batches of at most ROW_GROUP_SIZE rows
+        """
+
+        def convert(start: int) -> pa.RecordBatch:
+            return pa.RecordBatch.from_pandas(
+                df.iloc[start : start + ROW_GROUP_SIZE], schema=schema, preserve_index=False
+            )
+
+        starts = range(0, len(df), ROW_GROUP_SIZE)
+        if not starts:
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as converter:
+            pending = converter.submit(convert, starts[0])
+            for start in starts[1:]:
+                batch = pending.result()
+                pending = converter.submit(convert, start)
+                yield batch
+            yield pending.result()
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict) -> None:
+        """Serialize a dictionary to an indented JSON file"""
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(data, default=str, option=ORJSON_OPTIONS))
+        else:
+            with open(path, "w") as f:
+                json.dump(data, f, indent=2, default=str)
+
+    @staticmethod
+    def _read_json(path: Path) -> Dict:
+        """Parse a JSON file"""
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
+
+        with open(path, "r") as f:
+            return json.load(f)
+
     def save_metadata(
         self, metadata: Dict, dataset_name: str, profile: Optional[Dict] = None
     ) -> Path:
@@ -87,9 +255,7 @@ class ParquetLoader:
             full_metadata["data_profile"] = profile
 
         try:
-            with open(metadata_path, "w") as f:
-                json.dump(full_metadata, f, indent=2, default=str)
-
+            self._write_json(metadata_path, full_metadata)
             logger.info(f"Saved metadata to {metadata_path}")
             return metadata_path
 
@@ -97,28 +263,70 @@ class ParquetLoader:
             logger.error(f"Failed to save metadata for {dataset_name}: {e}")
             raise
 
-    def load_parquet(self, dataset_name: str) -> pd.DataFrame:
+    def save_dataset_metadata(self, metadata: Dict, dataset_name: str) -> Path:
+        """
+        Save the dataset-level (Kaggle) metadata once per dataset
+
+        Args:
+            metadata: Metadata dictionary
+            dataset_name: Name of the dataset
+
+        Returns:
+            Path to the saved metadata file
+        """
+        return self.save_metadata(metadata, dataset_name)
+
+    def save_file_profile(self, profile: Dict, output_name: str, dataset_name: str) -> Path:
+        """
+        Save the data profile of one output file
+
+        Args:
+            profile: Data profile
+            output_name: Name of the Parquet output the profile describes
+            dataset_name: Name of the dataset whose metadata the profile belongs to
+
+        Returns:
+            Path to the saved profile file
+        """
+        profile_path = self.metadata_dir / f"{output_name}_profile.json"
+
+        try:
+            self._write_json(profile_path, {"dataset_name": dataset_name, "data_profile": profile})
+            logger.info(f"Saved data profile to {profile_path}")
+            return profile_path
+
+        except Exception as e:
+            logger.error(f"Failed to save data profile for {output_name}: {e}")
+            raise
+
+    def load_parquet(self, dataset_name: str, arrow_dtypes: bool = False) -> pd.DataFrame:
         """
         Load a Parquet file
 
         Args:
             dataset_name: Name of the dataset to load
+            arrow_dtypes: Keep columns in Arrow-backed pandas dtypes (zero-copy strings)
+                instead of the default NumPy dtypes
 
         Returns:
             Loaded dataframe
         """
-        parquet_path = self.processed_data_dir / f"{dataset_name}.parquet"
-
-        if not parquet_path.exists():
-            # Try partitioned format
-            parquet_dir = self.processed_data_dir / dataset_name
-            if parquet_dir.exists():
-                parquet_path = parquet_dir
+        resolved = self.resolve(dataset_name)
+        parquet_path = (
+            resolved[0] if resolved else self.processed_data_dir / f"{dataset_name}.parquet"
+        )
 
         logger.info(f"Loading Parquet file: {parquet_path}")
 
         try:
-            df = pd.read_parquet(parquet_path, engine="pyarrow")
+            table = pq.read_table(parquet_path)
+            df = table.to_pandas(
+                types_mapper=pd.ArrowDtype if arrow_dtypes else None,
+                self_destruct=True,
+                split_blocks=True,
+                use_threads=True,
+            )
+            del table
             logger.info(f"Loaded {len(df)} rows from {dataset_name}")
             return df
 
@@ -126,21 +334,51 @@ class ParquetLoader:
             logger.error(f"Failed to load Parquet file for {dataset_name}: {e}")
             raise
 
-    def load_metadata(self, dataset_name: str) -> Dict:
+    def read_file_metadata(self, dataset_name: str) -> Dict[str, str]:
         """
-        Load dataset metadata
+        Read the key-value metadata stored in a Parquet footer
 
         Args:
             dataset_name: Name of the dataset
 
+        Returns:
+            Dictionary of metadata keys to values, excluding the pandas schema entry
+        """
+        resolved = self.resolve(dataset_name)
+        if resolved is None:
+            raise FileNotFoundError(f"No Parquet output found for {dataset_name}")
+
+        parquet_path, is_file, _ = resolved
+        schema = pq.read_schema(parquet_path) if is_file else pq.ParquetDataset(parquet_path).schema
+
+        return {
+            key.decode(): value.decode()
+            for key, value in (schema.metadata or {}).items()
+            if key != b"pandas"
+        }
+
+    def load_metadata(self, dataset_name: str) -> Dict:
+        """
+        Load dataset metadata, combined with the data profile of the output file
+
+        Args:
+            dataset_name: Name of the dataset or of one of its output files
+
         Returns:
             Metadata dictionary
         """
-        metadata_path = self.metadata_dir / f"{dataset_name}_metadata.json"
+        profile_path = self.metadata_dir / f"{dataset_name}_profile.json"
 
         try:
-            with open(metadata_path, "r") as f:
-                metadata = json.load(f)
+            if profile_path.exists():
+                # Dataset metadata and the per-file profile are stored separately
+                file_profile = self._read_json(profile_path)
+                metadata = self._read_json(
+                    self.metadata_dir / f"{file_profile['dataset_name']}_metadata.json"
+                )
+                metadata["data_profile"] = file_profile["data_profile"]
+            else:
+                metadata = self._read_json(self.metadata_dir / f"{dataset_name}_metadata.json")
 
             logger.info(f"Loaded metadata for {dataset_name}")
             return metadata
@@ -159,26 +397,37 @@ class ParquetLoader:
         Returns:
             Dictionary with Parquet file information
         """
-        parquet_path = self.processed_data_dir / f"{dataset_name}.parquet"
+        resolved = self.resolve(dataset_name)
+        if resolved is None:
+            parquet_path = self.processed_data_dir / f"{dataset_name}.parquet"
+            error = f"No Parquet output found at {parquet_path}"
+            logger.error(f"Failed to get Parquet info for {dataset_name}: {error}")
+            return {"path": str(parquet_path), "exists": False, "error": error}
 
-        if not parquet_path.exists():
-            parquet_dir = self.processed_data_dir / dataset_name
-            if parquet_dir.exists():
-                parquet_path = parquet_dir
+        parquet_path, is_file, size = resolved
 
         try:
-            df = pd.read_parquet(parquet_path, engine="pyarrow")
+            # Row counts and schema come from Parquet footers; no data pages are decoded
+            if is_file:
+                parquet_file = pq.ParquetFile(parquet_path)
+                schema = parquet_file.schema_arrow
+                rows = parquet_file.metadata.num_rows
+            else:
+                dataset = pq.ParquetDataset(parquet_path)
+                schema = dataset.schema
+                rows = sum(fragment.count_rows() for fragment in dataset.fragments)
+
+            # An empty table carries the pandas metadata, giving the same dtypes as a full read
+            dtypes = schema.empty_table().to_pandas().dtypes
 
             info = {
                 "path": str(parquet_path),
-                "exists": parquet_path.exists(),
-                "rows": len(df),
-                "columns": len(df.columns),
-                "size_mb": (
-                    parquet_path.stat().st_size / 1024**2 if parquet_path.is_file() else None
-                ),
-                "column_names": list(df.columns),
-                "dtypes": df.dtypes.astype(str).to_dict(),
+                "exists": True,
+                "rows": rows,
+                "columns": len(schema.names),
+                "size_mb": size / 1024**2 if is_file else None,
+                "column_names": schema.names,
+                "dtypes": dtypes.astype(str).to_dict(),
             }
 
             return info
@@ -3,11 +3,18 @@ Main ETL Pipeline orchestration
 """
 
 import logging
+import logging.handlers
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from tqdm import tqdm
 
 from .config import DatasetConfig, ETLConfig, ensure_directories
@@ -18,6 +25,38 @@ from .transformer import DataTransformer
 
 logger = logging.getLogger(__name__)
 
+# Bytes of CSV handed to each parser thread
+CSV_BLOCK_SIZE = 16 << 20
+
+# Cell values read as missing, matching pd.read_csv's default na_values
+CSV_NULL_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+# Frames buffered between the read, transform and write stages of a dataset
+STAGE_QUEUE_SIZE = 2
+
+# Seconds a blocked stage waits before re-checking for shutdown
+STAGE_POLL_INTERVAL = 0.1
+
 
 class ETLPipeline:
     """Main ETL Pipeline orchestrator"""
@@ -28,13 +67,105 @@ class ETLPipeline:
 
         # Initialize components
         self.extractor = KaggleExtractor(config.raw_data_dir)
-        self.transformer = DataTransformer(chunk_size=config.chunk_size)
+        self.transformer = DataTransformer(
+            chunk_size=config.chunk_size, schema_dir=config.metadata_dir
+        )
         self.loader = ParquetLoader(
-            config.processed_data_dir, config.metadata_dir, config.compression
+            config.processed_data_dir,
+            config.metadata_dir,
+            config.compression,
+            config.compression_level,
         )
 
         self.results = []
 
+    def _read_csv(self, csv_file: Path) -> pd.DataFrame:
+        """
+        Read a CSV file with PyArrow's multi-threaded CSV reader
+
+        Blocks are parsed in parallel straight into Arrow memory and converted to
+        pandas once with self_destruct, so Arrow buffers are released column by
+        column. Low-cardinality string columns are dictionary encoded and arrive
+        as categoricals. Missing-value markers follow pd.read_csv's defaults, in
+        string columns too.
+
+        Args:
+            csv_file: Path to the CSV file
+
+        Returns:
+            Loaded dataframe
+        """
+        try:
+            table = pacsv.read_csv(
+                csv_file,
+                read_options=pacsv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE),
+                convert_options=pacsv.ConvertOptions(
+                    auto_dict_encode=True,
+                    null_values=CSV_NULL_VALUES,
+                    strings_can_be_null=True,
+                ),
+            )
+        except pa.ArrowInvalid as e:
+            # Types are inferred from the first block; fall back if later blocks disagree
+            logger.warning(f"Arrow CSV reader failed for {csv_file.name} ({e}), using pandas")
+            return pd.read_csv(csv_file)
+
+        return table.to_pandas(self_destruct=True, split_blocks=True)
+
+    @staticmethod
+    def _put(out_q: queue.Queue, item: Any, stop: threading.Event) -> None:
+        """Put an item on a bounded stage queue, giving up once the pipeline stops"""
+        while not stop.is_set():
+            try:
+                out_q.put(item, timeout=STAGE_POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    @staticmethod
+    def _drain(in_q: queue.Queue, stop: threading.Event) -> Iterator[Any]:
+        """
+        Yield items from a stage queue until its end-of-stream sentinel
+
+        Raises:
+            Exception: Re-raises an error forwarded by the upstream stage
+        """
+        while not stop.is_set():
+            try:
+                item = in_q.get(timeout=STAGE_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def _run_stage(
+        self,
+        items: Iterable[Any],
+        work: Callable[[Any], Any],
+        out_q: queue.Queue,
+        stop: threading.Event,
+    ) -> None:
+        """
+        Thread body for one pipeline stage
+
+        Applies work to each input and passes results downstream, followed by a None
+        sentinel; an exception is forwarded downstream in place of the sentinel.
+        """
+        try:
+            for item in items:
+                if stop.is_set():
+                    return
+                self._put(out_q, work(item), stop)
+        except Exception as e:
+            self._put(out_q, e, stop)
+            return
+
+        self._put(out_q, None, stop)
+
     def process_dataset(self, dataset_config: DatasetConfig) -> Dict:
         """
         Process a single dataset through the ETL pipeline
@@ -71,15 +202,28 @@ class ETLPipeline:
 
             result["csv_files"] = [f.name for f in csv_files]
 
-            # Process each CSV file
-            for csv_file in csv_files:
+            file_metadata = self.transformer.get_file_metadata(dataset_config.name, metadata)
+            metadata_path = self.loader.save_dataset_metadata(metadata, dataset_config.name)
+            result["metadata_path"] = str(metadata_path)
+
+            def read(csv_file: Path):
                 logger.info(f"\nProcessing file: {csv_file.name}")
+                return csv_file, self._read_csv(csv_file)
+
+            def transform(item):
+                csv_file, df = item
+
+                # Determine output name
+                if len(csv_files) == 1:
+                    output_name = dataset_config.name
+                else:
+                    # Multiple files - use filename in output
+                    output_name = f"{dataset_config.name}_{csv_file.stem}"
 
                 # TRANSFORM
                 logger.info("Step 2/4: Transforming data...")
-                df = pd.read_csv(csv_file)
                 df_transformed = self.transformer.transform_dataframe(
-                    df, dataset_config.name, metadata
+                    df, dataset_config.name, schema_name=output_name
                 )
 
                 # Generate data profile
@@ -91,26 +235,48 @@ class ETLPipeline:
                     logger.info("Step 3.5/4: Applying deployment sampling...")
                     df_transformed = DataSampler.sample(df_transformed, dataset_config.sampling)
 
-                # LOAD
-                logger.info("Step 4/4: Loading to Parquet format...")
-
-                # Determine output name
-                if len(csv_files) == 1:
-                    output_name = dataset_config.name
-                else:
-                    # Multiple files - use filename in output
-                    output_name = f"{dataset_config.name}_{csv_file.stem}"
-
-                parquet_path = self.loader.save_to_parquet(df_transformed, output_name)
+                return output_name, df_transformed, profile
+
+            # Process each CSV file: reading and transforming run on their own threads,
+            # so the next file is parsed while the previous one is written
+            stop = threading.Event()
+            read_q: queue.Queue = queue.Queue(maxsize=STAGE_QUEUE_SIZE)
+            write_q: queue.Queue = queue.Queue(maxsize=STAGE_QUEUE_SIZE)
+            stages = [
+                threading.Thread(
+                    target=self._run_stage, args=(csv_files, read, read_q, stop), daemon=True
+                ),
+                threading.Thread(
+                    target=self._run_stage,
+                    args=(self._drain(read_q, stop), transform, write_q, stop),
+                    daemon=True,
+                ),
+            ]
+            for stage in stages:
+                stage.start()
+
+            try:
+                for output_name, df_transformed, profile in self._drain(write_q, stop):
+                    # LOAD
+                    logger.info("Step 4/4: Loading to Parquet format...")
+                    parquet_path = self.loader.save_to_parquet(
+                        df_transformed, output_name, file_metadata=file_metadata
+                    )
 
-                # Save metadata
-                metadata_path = self.loader.save_metadata(metadata, output_name, profile)
+                    # Save the file's data profile
+                    profile_path = self.loader.save_file_profile(
+                        profile, output_name, dataset_config.name
+                    )
 
-                result["status"] = "success"
-                result["parquet_path"] = str(parquet_path)
-                result["metadata_path"] = str(metadata_path)
-                result["rows"] = len(df_transformed)
-                result["columns"] = len(df_transformed.columns)
+                    result["status"] = "success"
+                    result["parquet_path"] = str(parquet_path)
+                    result["profile_path"] = str(profile_path)
+                    result["rows"] = len(df_transformed)
+                    result["columns"] = len(df_transformed.columns)
+            finally:
+                stop.set()
+                for stage in stages:
+                    stage.join()
 
             end_time = datetime.now()
             result["end_time"] = end_time.isoformat()
@@ -154,24 +320,56 @@ class ETLPipeline:
 
         logger.info(f"Starting ETL pipeline for {len(datasets_to_process)} datasets")
 
-        # Process each dataset
-        for dataset_config in tqdm(datasets_to_process, desc="Processing datasets"):
-            # Check if already processed
-            if skip_existing:
-                parquet_path = self.config.processed_data_dir / f"{dataset_config.name}.parquet"
-                if parquet_path.exists():
-                    logger.info(f"Skipping {dataset_config.name} - already exists")
-                    self.results.append(
-                        {
-                            "dataset_name": dataset_config.name,
-                            "status": "skipped",
-                            "reason": "already_exists",
-                        }
-                    )
-                    continue
-
-            result = self.process_dataset(dataset_config)
-            self.results.append(result)
+        # Check which datasets are already processed
+        pending = []
+        for dataset_config in datasets_to_process:
+            if skip_existing and self.loader.resolve(dataset_config.name) is not None:
+                logger.info(f"Skipping {dataset_config.name} - already exists")
+                self.results.append(
+                    {
+                        "dataset_name": dataset_config.name,
+                        "status": "skipped",
+                        "reason": "already_exists",
+                    }
+                )
+                continue
+
+            pending.append(dataset_config)
+
+        # Process remaining datasets - independent, so run them in parallel worker processes
+        max_workers = min(self.config.max_workers, len(pending))
+        if max_workers <= 1:
+            for dataset_config in tqdm(pending, desc="Processing datasets"):
+                self.results.append(self.process_dataset(dataset_config))
+        else:
+            results: List[Optional[Dict]] = [None] * len(pending)
+
+            # Workers forward log records to this process, which writes them through
+            # its own handlers (spawned workers start with no logging configured)
+            root_logger = logging.getLogger()
+            log_queue = multiprocessing.Queue()
+            listener = logging.handlers.QueueListener(
+                log_queue, *root_logger.handlers, respect_handler_level=True
+            )
+            listener.start()
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_worker,
+                    initargs=(self.config, log_queue, root_logger.level),
+                ) as executor:
+                    futures = {
+                        executor.submit(_process_in_worker, dataset_config): idx
+                        for idx, dataset_config in enumerate(pending)
+                    }
+                    for future in tqdm(
+                        as_completed(futures), total=len(futures), desc="Processing datasets"
+                    ):
+                        results[futures[future]] = future.result()
+            finally:
+                listener.stop()
+
+            self.results.extend(results)
 
         # Summary
         self._print_summary()
@@ -212,3 +410,36 @@ class ETLPipeline:
             "skipped": sum(1 for r in self.results if r["status"] == "skipped"),
             "results": self.results,
         }
+
+
+# Per-process pipeline used by ETLPipeline.run's worker pool
+_worker_pipeline: Optional[ETLPipeline] = None
+
+
+def _init_worker(config: ETLConfig, log_queue: multiprocessing.Queue, log_level: int) -> None:
+    """
+    Build one pipeline (and Kaggle client) per worker process
+
+    Args:
+        config: ETL configuration
+        log_queue: Queue drained by the parent's QueueListener
+        log_level: Root logger level of the parent process
+    """
+    global _worker_pipeline
+
+    # Replace any handlers inherited by fork so records are written once, by the parent.
+    # QueueHandler bakes its formatted message into the record, so keep it bare and let
+    # the parent's formatters add timestamps and levels.
+    logging.basicConfig(
+        level=log_level,
+        format="%(message)s",
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+        force=True,
+    )
+
+    _worker_pipeline = ETLPipeline(config)
+
+
+def _process_in_worker(dataset_config: DatasetConfig) -> Dict:
+    """Process a single dataset in a worker process"""
+    return _worker_pipeline.process_dataset(dataset_config)
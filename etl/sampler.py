@@ -5,6 +5,7 @@ Data sampling for deployment and testing
 import logging
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from .config import SamplingConfig
@@ -64,7 +65,10 @@ class DataSampler:
     @staticmethod
     def _random_sample(df: pd.DataFrame, n_samples: int) -> pd.DataFrame:
         """Simple random sampling"""
-        return df.sample(n=min(n_samples, len(df)), random_state=42)
+        rng = np.random.default_rng(42)
+        # Sorted positions turn the row gather into a mostly sequential scan
+        positions = np.sort(rng.choice(len(df), size=min(n_samples, len(df)), replace=False))
+        return df.take(positions)
 
     @staticmethod
     def _stratified_sample(
@@ -77,19 +81,29 @@ class DataSampler:
             )
             return DataSampler._random_sample(df, n_samples)
 
-        # Calculate samples per stratum
-        sampled = df.groupby(stratify_column, group_keys=False).apply(
-            lambda x: x.sample(
-                n=min(len(x), max(1, int(n_samples * len(x) / len(df)))),
-                random_state=42,
-            )
+        # Row positions per stratum
+        groups = list(
+            df.groupby(stratify_column, sort=False, observed=True).indices.values()
+        )
+        if not groups:
+            return df.iloc[:0]
+
+        sizes = np.array([len(idx) for idx in groups], dtype=np.int64)
+        n_samples = min(n_samples, int(sizes.sum()))
+        rng = np.random.default_rng(42)
+
+        # Exact per-stratum counts summing to n_samples, proportional in expectation;
+        # when there is room, every stratum is guaranteed at least one row
+        if n_samples >= len(sizes):
+            take = rng.multivariate_hypergeometric(sizes - 1, n_samples - len(sizes)) + 1
+        else:
+            take = rng.multivariate_hypergeometric(sizes, n_samples)
+
+        selected = np.concatenate(
+            [rng.choice(idx, size=k, replace=False) for idx, k in zip(groups, take)]
         )
 
-        # Ensure we don't exceed max_samples
-        if len(sampled) > n_samples:
-            sampled = sampled.sample(n=n_samples, random_state=42)
-
-        return sampled
+        return df.take(selected)
 
     @staticmethod
     def _time_series_sample(
@@ -102,11 +116,27 @@ class DataSampler:
             )
             return DataSampler._random_sample(df, n_samples)
 
-        # Sort by time
-        df_sorted = df.sort_values(time_column)
-
-        # Take every Nth row to maintain temporal coverage
-        step = max(1, len(df_sorted) // n_samples)
-        sampled = df_sorted.iloc[::step].head(n_samples)
-
-        return sampled
+        column = df[time_column]
+        if pd.api.types.is_datetime64_any_dtype(column):
+            valid = column.notna().to_numpy()
+            times = pd.DatetimeIndex(column[valid]).asi8
+        elif pd.api.types.is_numeric_dtype(column):
+            valid = column.notna().to_numpy()
+            times = column[valid].to_numpy(dtype=np.float64)
+        else:
+            # Unordered types: sort by time and take every Nth row
+            df_sorted = df.sort_values(time_column)
+            step = max(1, len(df_sorted) // n_samples)
+            return df_sorted.iloc[::step].head(n_samples)
+
+        # Order rows by time without sorting the frame (missing times last, as
+        # sort_values does), then take every Nth row by rank for temporal coverage.
+        # A full stable argsort is kept on purpose: np.argpartition could find the
+        # values at the sampled ranks, but not which of several rows sharing a
+        # timestamp sort_values(kind="stable") would pick, and resolving those ties
+        # costs another O(N log k) pass that eats the saving over the sort
+        rows = np.flatnonzero(valid)
+        order = np.concatenate([rows[np.argsort(times, kind="stable")], np.flatnonzero(~valid)])
+        step = max(1, len(order) // n_samples)
+
+        return df.iloc[order[::step][:n_samples]]
@@ -2,31 +2,53 @@
 Data transformation module - handles data cleaning and preprocessing
 """
 
+import json
 import logging
+import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 logger = logging.getLogger(__name__)
 
+# Candidate integer types for downcasting, narrowest first
+INT_DOWNCAST_DTYPES = (np.int8, np.int16, np.int32)
+
+# Characters stripped from standardized column names
+COLUMN_NAME_INVALID_CHARS = re.compile(r"[^a-z0-9_]")
+
+# Combined row keys are re-factorized before they could overflow int64
+ROW_KEY_LIMIT = 1 << 62
+
 
 class DataTransformer:
     """Handles transformation and cleaning of datasets"""
 
-    def __init__(self, chunk_size: int = 10000):
+    def __init__(self, chunk_size: int = 10000, schema_dir: Optional[Path] = None):
         self.chunk_size = chunk_size
+        self.schema_dir = schema_dir
 
     def transform_dataframe(
-        self, df: pd.DataFrame, dataset_name: str, metadata: Optional[Dict] = None
+        self,
+        df: pd.DataFrame,
+        dataset_name: str,
+        schema_name: Optional[str] = None,
     ) -> pd.DataFrame:
         """
         Apply transformations to a dataframe
 
+        When schema_dir is set, the dtypes and dropped columns inferred on the first
+        run are saved as {schema_name}_schema.json and later runs cast to them
+        directly instead of re-inferring column types.
+
         Args:
             df: Input dataframe
             dataset_name: Name of the dataset
-            metadata: Optional metadata dictionary
+            schema_name: Name of the cached schema (defaults to dataset_name)
 
         Returns:
             Transformed dataframe
@@ -34,24 +56,30 @@ class DataTransformer:
         logger.info(f"Transforming dataset: {dataset_name}")
         logger.info(f"Original shape: {df.shape}")
 
-        # Create a copy to avoid modifying original
-        df_transformed = df.copy()
+        # Shallow copy: whole-column assignments below replace columns in the copy only,
+        # so the caller's frame is untouched without copying any data
+        df = df.copy(deep=False)
 
         # 1. Standardize column names
-        df_transformed = self._standardize_columns(df_transformed)
-
-        # 2. Handle missing values
-        df_transformed = self._handle_missing_values(df_transformed, dataset_name)
-
-        # 3. Infer and optimize data types
-        df_transformed = self._optimize_dtypes(df_transformed)
+        df_transformed = self._standardize_columns(df)
+
+        # 2-3. Cast to a cached schema, or handle missing values and infer data types
+        schema_name = schema_name or dataset_name
+        schema = self._load_schema(schema_name)
+        specialized = self._apply_schema(df_transformed, schema) if schema else None
+
+        if specialized is not None:
+            logger.info(f"Applied cached schema for {schema_name}")
+            df_transformed = specialized
+        else:
+            raw_columns = list(df_transformed.columns)
+            df_transformed = self._handle_missing_values(df_transformed, dataset_name)
+            df_transformed = self._optimize_dtypes(df_transformed)
+            self._save_schema(schema_name, raw_columns, df_transformed)
 
         # 4. Remove duplicate rows
         df_transformed = self._remove_duplicates(df_transformed)
 
-        # 5. Add metadata columns
-        df_transformed = self._add_metadata_columns(df_transformed, dataset_name, metadata)
-
         logger.info(f"Transformed shape: {df_transformed.shape}")
         logger.info(
             f"Memory usage: {df_transformed.memory_usage(deep=True).sum() / 1024**2:.2f} MB"
@@ -61,21 +89,92 @@ class DataTransformer:
 
     def _standardize_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """Standardize column names to lowercase with underscores"""
-        df.columns = (
-            df.columns.str.strip()
-            .str.lower()
-            .str.replace(" ", "_")
-            .str.replace("[^a-z0-9_]", "", regex=True)
+        df = df.set_axis(
+            [
+                COLUMN_NAME_INVALID_CHARS.sub("", str(col).strip().lower().replace(" ", "_"))
+                for col in df.columns
+            ],
+            axis=1,
         )
         logger.debug(f"Standardized column names: {list(df.columns)}")
         return df
 
+    def _schema_path(self, schema_name: str) -> Optional[Path]:
+        """Path of the cached schema file, or None when schema caching is disabled"""
+        if self.schema_dir is None:
+            return None
+        return self.schema_dir / f"{schema_name}_schema.json"
+
+    def _load_schema(self, schema_name: str) -> Optional[Dict]:
+        """Load a cached schema if one exists"""
+        schema_path = self._schema_path(schema_name)
+        if schema_path is None:
+            return None
+
+        try:
+            with open(schema_path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable schema cache {schema_path}: {e}")
+            return None
+
+    def _save_schema(self, schema_name: str, raw_columns: List[str], df: pd.DataFrame) -> None:
+        """Persist inferred dtypes and dropped columns for later runs"""
+        schema_path = self._schema_path(schema_name)
+        if schema_path is None:
+            return
+
+        schema = {
+            "column_dtypes": df.dtypes.astype(str).to_dict(),
+            "dropped_columns": [col for col in raw_columns if col not in df.columns],
+            "category_columns": [
+                col for col, dtype in df.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)
+            ],
+        }
+
+        try:
+            with open(schema_path, "w") as f:
+                json.dump(schema, f, indent=2)
+            logger.debug(f"Saved schema cache to {schema_path}")
+        except OSError as e:
+            logger.warning(f"Failed to save schema cache {schema_path}: {e}")
+
+    def _apply_schema(self, df: pd.DataFrame, schema: Dict) -> Optional[pd.DataFrame]:
+        """
+        Cast a dataframe to a cached schema in one astype call
+
+        Returns None when the data no longer matches the schema (different columns,
+        values outside a narrowed numeric type, or a failed cast), so the caller can
+        fall back to full inference.
+        """
+        df = df.drop(columns=schema.get("dropped_columns", []), errors="ignore")
+        column_dtypes = schema.get("column_dtypes", {})
+        if list(df.columns) != list(column_dtypes):
+            return None
+
+        try:
+            for col, dtype in column_dtypes.items():
+                target = pd.api.types.pandas_dtype(dtype)
+                if target.kind in "iuf" and pd.api.types.is_numeric_dtype(df[col]):
+                    # astype wraps silently on overflow; only narrow values that fit
+                    info = np.iinfo(target) if target.kind in "iu" else np.finfo(target)
+                    low, high = df[col].min(), df[col].max()
+                    if not pd.isna(low) and (low < info.min or high > info.max):
+                        return None
+
+            return df.astype(column_dtypes)
+        except (ValueError, TypeError) as e:
+            logger.info(f"Cached schema no longer applies ({e}), re-inferring dtypes")
+            return None
+
     def _handle_missing_values(self, df: pd.DataFrame, dataset_name: str) -> pd.DataFrame:
         """Handle missing values with dataset-aware strategies"""
-        missing_counts = df.isnull().sum()
+        missing_counts = df.isna().sum()
         missing_pct = (missing_counts / len(df)) * 100
 
-        if missing_counts.sum() > 0:
+        if missing_counts.any():
             logger.info(f"Missing values found:")
             for col, pct in missing_pct[missing_pct > 0].items():
                 logger.info(f"  {col}: {pct:.2f}%")
@@ -111,15 +210,16 @@ class DataTransformer:
                     pass
 
                 # Check if it should be categorical
-                num_unique = df[col].nunique()
+                num_unique = self._count_distinct(df[col])
                 num_total = len(df[col])
                 if num_unique / num_total < 0.5:  # Less than 50% unique values
                     df[col] = df[col].astype("category")
 
             elif col_type in ["int64", "int32"]:
-                # Downcast integers
-                downcast_col = pd.to_numeric(df[col], downcast="integer")
-                df[col] = downcast_col
+                # Downcast integers to the narrowest type that holds min/max
+                target_dtype = self._smallest_int_dtype(df[col])
+                if target_dtype != col_type:
+                    df[col] = df[col].astype(target_dtype)
 
             elif col_type in ["float64", "float32"]:
                 # Downcast floats
@@ -128,10 +228,34 @@ class DataTransformer:
 
         return df
 
+    @staticmethod
+    def _smallest_int_dtype(series: pd.Series) -> np.dtype:
+        """Pick the narrowest integer dtype for a column from one Arrow min/max pass"""
+        bounds = pc.min_max(pa.array(series.to_numpy()))
+        low, high = bounds["min"].as_py(), bounds["max"].as_py()
+        if low is None:
+            return series.dtype
+
+        for dtype in INT_DOWNCAST_DTYPES:
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                return np.dtype(dtype)
+
+        return series.dtype
+
+    @staticmethod
+    def _count_distinct(series: pd.Series) -> int:
+        """Count distinct non-null values using Arrow's hash kernel"""
+        try:
+            return pc.count_distinct(pa.array(series, from_pandas=True)).as_py()
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Mixed-type object columns cannot be converted to a single Arrow type
+            return series.nunique()
+
     def _remove_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
         """Remove duplicate rows"""
         original_len = len(df)
-        df = df.drop_duplicates()
+        df = df.iloc[self._first_occurrences(df)]
         duplicates_removed = original_len - len(df)
 
         if duplicates_removed > 0:
@@ -139,16 +263,65 @@ class DataTransformer:
 
         return df
 
-    def _add_metadata_columns(
-        self, df: pd.DataFrame, dataset_name: str, metadata: Optional[Dict]
-    ) -> pd.DataFrame:
-        """Add metadata columns for tracking"""
-        df["_dataset_name"] = dataset_name
+    @staticmethod
+    def _first_occurrences(df: pd.DataFrame) -> np.ndarray:
+        """
+        Positions of the first occurrence of each distinct row
+
+        Each column is dictionary encoded by Arrow's hash kernel and the per-column
+        codes are folded into a single int64 row key, so only one integer column
+        is hashed to find duplicates.
+        """
+        if df.columns.empty:
+            return np.arange(len(df))
+
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            row_key = np.zeros(len(df), dtype=np.int64)
+            key_cardinality = 1
+
+            for column in table.columns:
+                encoded = column.combine_chunks()
+                if pa.types.is_floating(encoded.type):
+                    # pandas treats -0.0 and 0.0 as equal; Arrow hashes them apart
+                    encoded = pc.add(encoded, pa.scalar(0.0, encoded.type))
+                if not pa.types.is_dictionary(encoded.type):
+                    encoded = pc.dictionary_encode(encoded, null_encoding="encode")
+
+                # Nulls already in a dictionary column get a code of their own
+                cardinality = len(encoded.dictionary) + 1
+                codes = pc.fill_null(encoded.indices, cardinality - 1)
+
+                if key_cardinality * cardinality >= ROW_KEY_LIMIT:
+                    row_key, uniques = pd.factorize(row_key)
+                    key_cardinality = len(uniques)
+
+                row_key = row_key * cardinality + codes.to_numpy().astype(np.int64)
+                key_cardinality *= cardinality
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Mixed-type object columns cannot be converted to a single Arrow type
+            return np.flatnonzero(~df.duplicated().to_numpy())
+
+        return np.flatnonzero(~pd.Series(row_key).duplicated().to_numpy())
+
+    @staticmethod
+    def get_file_metadata(dataset_name: str, metadata: Optional[Dict] = None) -> Dict[str, str]:
+        """
+        Dataset tracking fields stored as Parquet key-value metadata instead of columns
+
+        Args:
+            dataset_name: Name of the dataset
+            metadata: Optional metadata dictionary
+
+        Returns:
+            Dictionary of metadata keys to values
+        """
+        file_metadata = {"_dataset_name": dataset_name}
 
         if metadata:
-            df["_dataset_category"] = metadata.get("category", "unknown")
+            file_metadata["_dataset_category"] = str(metadata.get("category", "unknown"))
 
-        return df
+        return file_metadata
 
     def get_data_profile(self, df: pd.DataFrame) -> Dict:
         """
@@ -160,31 +333,42 @@ class DataTransformer:
         Returns:
             Dictionary containing profile information
         """
+        # One null scan for the whole frame, reused for every column
+        null_counts = df.isna().sum()
+        nrows = len(df)
+
         profile = {
-            "shape": {"rows": len(df), "columns": len(df.columns)},
+            "shape": {"rows": nrows, "columns": len(df.columns)},
             "memory_usage_mb": df.memory_usage(deep=True).sum() / 1024**2,
             "columns": {},
-            "missing_values": df.isnull().sum().to_dict(),
+            "missing_values": null_counts.to_dict(),
             "dtypes": df.dtypes.astype(str).to_dict(),
         }
 
-        # Column-level statistics
+        # Column-level statistics, each computed in one frame-wide pass
+        unique_counts = df.nunique()
+        numeric_cols = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col])]
+        # agg raises on an empty column selection, so skip it for all-text frames
+        numeric_stats = (
+            df[numeric_cols].agg(["mean", "std", "min", "max"]) if numeric_cols else None
+        )
+
         for col in df.columns:
+            missing = null_counts[col]
             col_profile = {
-                "dtype": str(df[col].dtype),
-                "missing_count": int(df[col].isnull().sum()),
-                "missing_pct": float((df[col].isnull().sum() / len(df)) * 100),
-                "unique_count": int(df[col].nunique()),
+                "dtype": profile["dtypes"][col],
+                "missing_count": int(missing),
+                "missing_pct": float((missing / nrows) * 100),
+                "unique_count": int(unique_counts[col]),
             }
 
             # Add numeric statistics if applicable
-            if pd.api.types.is_numeric_dtype(df[col]):
+            if numeric_stats is not None and col in numeric_stats.columns:
+                has_values = missing < nrows
                 col_profile.update(
                     {
-                        "mean": float(df[col].mean()) if not df[col].isnull().all() else None,
-                        "std": float(df[col].std()) if not df[col].isnull().all() else None,
-                        "min": float(df[col].min()) if not df[col].isnull().all() else None,
-                        "max": float(df[col].max()) if not df[col].isnull().all() else None,
+                        stat: float(numeric_stats.at[stat, col]) if has_values else None
+                        for stat in ("mean", "std", "min", "max")
                     }
                 )
 
@@ -3,13 +3,53 @@
 Migrate DashSpec YAML files from v1.2 to v1.3
 
 Extracts common formatting properties and creates default_formatting field.
+
+YAML is parsed and emitted with libyaml (CSafeLoader/CSafeDumper) when PyYAML was
+built against it, falling back to the pure-Python SafeLoader/SafeDumper otherwise.
+When ruamel.yaml is installed, migrated files are edited in round-trip mode so
+comments, quoting and untouched sections keep their original layout.
 """
 
 import yaml
+import hashlib
+import io
+import json
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
-from collections import Counter
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+# Unlimited line width: libyaml treats a negative width as "no limit", the
+# pure-Python emitter compares against the width directly
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    UNLIMITED_WIDTH = -1
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    UNLIMITED_WIDTH = float('inf')
+
+try:
+    from ruamel.yaml import YAML
+except ImportError:
+    YAML = None
+
+# Block style, original key order, no line wrapping, non-ASCII written as-is
+DUMP_OPTIONS = dict(Dumper=SafeDumper, default_flow_style=False, sort_keys=False,
+                    width=UNLIMITED_WIDTH, allow_unicode=True)
+
+# Top-level version line, optionally quoted
+VERSION_LINE = re.compile(r'(?m)^(dsl_version:\s*["\']?)1\.2\.0')
+
+# Formatting properties considered for default_formatting, in output order
+_TRACKED_FORMAT_PROPS = ('type', 'precision', 'use_thousands_separator', 'significant_digits')
+
+# Only generic types make sensible defaults (currency/percent are too specific)
+_VALID_DEFAULT_TYPES = frozenset({'number', 'integer'})
 
 
 def analyze_formatting(formatting: Optional[Dict[str, Dict]]) -> Optional[Dict]:
@@ -17,55 +57,34 @@ def analyze_formatting(formatting: Optional[Dict[str, Dict]]) -> Optional[Dict]:
     Analyze formatting rules to find common properties
     Returns the most common property values that could be defaults
     """
-    if not formatting:
+    # Only create defaults if there are at least 3 fields with common properties
+    if not formatting or len(formatting) < 3:
         return None
 
-    # Count property values across all fields
-    type_counter = Counter()
-    precision_counter = Counter()
-    thousands_counter = Counter()
-    sig_digits_counter = Counter()
+    # Count property values across all fields in one pass
+    counts: Dict[str, Dict[Any, int]] = {}
 
     for field_name, format_spec in formatting.items():
-        if 'type' in format_spec:
-            type_counter[format_spec['type']] += 1
-        if 'precision' in format_spec:
-            precision_counter[format_spec['precision']] += 1
-        if 'use_thousands_separator' in format_spec:
-            thousands_counter[format_spec['use_thousands_separator']] += 1
-        if 'significant_digits' in format_spec:
-            sig_digits_counter[format_spec['significant_digits']] += 1
-
-    # Only create defaults if there are at least 3 fields with common properties
-    if len(formatting) < 3:
-        return None
+        for prop in _TRACKED_FORMAT_PROPS:
+            if prop in format_spec:
+                value = format_spec[prop]
+                prop_counts = counts.get(prop)
+                if prop_counts is None:
+                    prop_counts = counts[prop] = {}
+                prop_counts[value] = prop_counts.get(value, 0) + 1
 
     default_format = {}
 
-    # If most fields share a type (but not currency), use it as default
-    if type_counter:
-        most_common_type, count = type_counter.most_common(1)[0]
-        # Only use 'number' or 'integer' as defaults (not currency/percent - too specific)
-        if count >= 3 and most_common_type in ['number', 'integer']:
-            default_format['type'] = most_common_type
-
-    # If most fields share precision
-    if precision_counter:
-        most_common_precision, count = precision_counter.most_common(1)[0]
-        if count >= 3:
-            default_format['precision'] = most_common_precision
-
-    # If most fields share use_thousands_separator
-    if thousands_counter:
-        most_common_thousands, count = thousands_counter.most_common(1)[0]
-        if count >= 3:
-            default_format['use_thousands_separator'] = most_common_thousands
-
-    # If most fields share significant_digits
-    if sig_digits_counter:
-        most_common_sig, count = sig_digits_counter.most_common(1)[0]
-        if count >= 3:
-            default_format['significant_digits'] = most_common_sig
+    for prop in _TRACKED_FORMAT_PROPS:
+        prop_counts = counts.get(prop)
+        if not prop_counts:
+            continue
+        most_common_value, count = max(prop_counts.items(), key=itemgetter(1))
+        if count < 3:
+            continue
+        if prop == 'type' and most_common_value not in _VALID_DEFAULT_TYPES:
+            continue
+        default_format[prop] = most_common_value
 
     return default_format if default_format else None
 
@@ -76,126 +95,296 @@ def simplify_formatting(formatting: Dict[str, Dict], default_format: Dict) -> Di
     Only keep properties that override defaults
     """
     simplified = {}
+    defaults_items = default_format.items()
 
     for field_name, format_spec in formatting.items():
-        # Start with a copy of the format spec
-        new_spec = dict(format_spec)
-
-        # Remove properties that match defaults
-        for prop, default_value in default_format.items():
-            if prop in new_spec and new_spec[prop] == default_value:
-                del new_spec[prop]
+        # Keep only properties whose (key, value) pair differs from the defaults;
+        # membership on an items view is a key lookup plus equality check
+        overrides = {
+            prop: value for prop, value in format_spec.items() if (prop, value) not in defaults_items
+        }
 
         # Only include field if it has overrides
-        if new_spec:
-            simplified[field_name] = new_spec
+        if overrides:
+            simplified[field_name] = overrides
 
     return simplified
 
 
-def migrate_yaml(file_path: Path, dry_run: bool = False) -> bool:
+def write_yaml(file_path: Path, content: Dict) -> None:
+    """Dump YAML into a buffer and write the file in one call"""
+    buffer = io.StringIO()
+    yaml.dump(content, buffer, **DUMP_OPTIONS)
+    file_path.write_text(buffer.getvalue(), encoding='utf-8')
+
+
+def round_trip_yaml() -> 'YAML':
+    """ruamel.yaml round-trip instance keeping quotes, without line wrapping"""
+    yaml_rt = YAML(typ='rt')
+    yaml_rt.preserve_quotes = True
+    yaml_rt.width = float('inf')
+    return yaml_rt
+
+
+def write_round_trip(file_path: Path, yaml_rt: 'YAML', content: Dict) -> None:
+    """Dump a ruamel.yaml round-trip tree into a buffer and write the file in one call"""
+    buffer = io.StringIO()
+    yaml_rt.dump(content, buffer)
+    file_path.write_text(buffer.getvalue(), encoding='utf-8')
+
+
+def apply_round_trip(data_source: Dict, default_format: Dict,
+                     simplified_formatting: Dict[str, Dict]) -> None:
+    """
+    Apply the migration to a data_source of the ruamel.yaml round-trip tree
+    Edits are made in place so comments and layout outside them are preserved
+    """
+    formatting = data_source['formatting']
+    if 'default_formatting' in data_source:
+        # Re-migrated files: drop the old key so the new one lands before formatting
+        del data_source['default_formatting']
+    idx = list(data_source).index('formatting')
+
+    if simplified_formatting:
+        for field_name in list(formatting):
+            overrides = simplified_formatting.get(field_name)
+            if overrides is None:
+                del formatting[field_name]
+                continue
+            format_spec = formatting[field_name]
+            for prop in list(format_spec):
+                if prop not in overrides:
+                    del format_spec[prop]
+    else:
+        del data_source['formatting']
+
+    data_source.insert(idx, 'default_formatting', default_format)
+
+
+def replace_formatting(data_source: Dict, default_format: Dict,
+                       simplified_formatting: Dict[str, Dict]) -> Dict:
+    """
+    Rebuild a data_source with default_formatting and simplified formatting
+    default_formatting is placed right before formatting to preserve key order
+    """
+    new_items = []
+    for key, value in data_source.items():
+        if key == 'default_formatting':
+            continue
+        if key == 'formatting':
+            # Insert default_formatting before formatting
+            new_items.append(('default_formatting', default_format))
+            if not simplified_formatting:
+                continue
+            value = simplified_formatting
+        new_items.append((key, value))
+    return dict(new_items)
+
+
+def write_version_bump(file_path: Path, text: str, content: Dict,
+                       yaml_rt: Optional['YAML'] = None) -> None:
+    """
+    Rewrite only the version line when nothing else changes
+    Falls back to a full dump if the version line cannot be matched textually
+    """
+    new_text, replaced = VERSION_LINE.subn(r'\g<1>1.3.0', text, count=1)
+    if replaced:
+        file_path.write_text(new_text, encoding='utf-8')
+    elif yaml_rt is not None:
+        write_round_trip(file_path, yaml_rt, content)
+    else:
+        write_yaml(file_path, content)
+
+
+def migrate_yaml(file_path: Path, dry_run: bool = False, plan_entry: Optional[Dict] = None) -> bool:
     """
     Migrate a single YAML file to v1.3
     Returns True if changes were made
+
+    plan_entry holds default_format/simplified_formatting from an earlier run;
+    it is used instead of re-analysing when its digest matches the file, and is
+    refreshed with the results of this run
     """
     print(f"\n{'[DRY RUN] ' if dry_run else ''}Processing: {file_path}")
 
     # Load YAML
-    with open(file_path, 'r') as f:
-        content = yaml.safe_load(f)
+    with open(file_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    # Round-trip output edits ruamel.yaml's own tree, so parse the file with it
+    # once; otherwise (or when nothing is written) libyaml is much faster
+    yaml_rt = round_trip_yaml() if YAML is not None and not dry_run else None
+    if yaml_rt is not None:
+        content = yaml_rt.load(text)
+    else:
+        content = yaml.load(text, Loader=SafeLoader)
 
     # Check version
-    if content.get('dsl_version') != '1.2.0':
-        print(f"  ⏭️  Skipping (not v1.2.0, found: {content.get('dsl_version')})")
+    version = content.get('dsl_version')
+    if version != '1.2.0':
+        print(f"  ⏭️  Skipping (not v1.2.0, found: {version})")
         return False
 
     # Update version
     content['dsl_version'] = '1.3.0'
 
-    # Check if formatting exists
-    data_source = content.get('dashboard', {}).get('data_source', {})
-    formatting = data_source.get('formatting')
+    # Check if formatting exists (present in virtually every spec, so index directly)
+    try:
+        dashboard = content['dashboard']
+        data_source = dashboard['data_source']
+        formatting = data_source['formatting']
+    except (KeyError, TypeError):
+        formatting = None
 
     if not formatting:
         print("  ℹ️  No formatting section found")
         if not dry_run:
-            with open(file_path, 'w') as f:
-                yaml.dump(content, f, default_flow_style=False, sort_keys=False)
+            write_version_bump(file_path, text, content, yaml_rt)
         print("  ✅ Updated version to 1.3.0")
         return True
 
-    # Analyze formatting
-    default_format = analyze_formatting(formatting)
+    # Analyze formatting, unless a plan for this exact file content is available
+    digest = hashlib.sha1(text.encode()).hexdigest()
+    if plan_entry is not None and plan_entry.get('digest') == digest:
+        default_format = plan_entry['default_format']
+        simplified_formatting = plan_entry['simplified_formatting']
+    else:
+        default_format = analyze_formatting(formatting)
+        simplified_formatting = simplify_formatting(formatting, default_format) if default_format else None
+        if plan_entry is not None:
+            plan_entry.update(digest=digest, default_format=default_format,
+                              simplified_formatting=simplified_formatting)
 
     if not default_format:
         print(f"  ℹ️  No common formatting patterns found ({len(formatting)} fields)")
         if not dry_run:
-            with open(file_path, 'w') as f:
-                yaml.dump(content, f, default_flow_style=False, sort_keys=False)
+            write_version_bump(file_path, text, content, yaml_rt)
         print("  ✅ Updated version to 1.3.0")
         return True
 
     print(f"  📊 Found common pattern: {default_format}")
 
-    # Simplify formatting
-    simplified_formatting = simplify_formatting(formatting, default_format)
+    if not simplified_formatting:
+        print("  🗑️  Removed formatting section (all fields use defaults)")
 
-    # Update data_source with default_formatting and simplified formatting
-    # We need to preserve order: default_formatting should come before formatting
-    new_data_source = {}
-
-    # Copy all fields up to formatting
-    for key in data_source:
-        if key == 'formatting':
-            # Insert default_formatting before formatting
-            new_data_source['default_formatting'] = default_format
-            if simplified_formatting:
-                new_data_source['formatting'] = simplified_formatting
-            else:
-                print("  🗑️  Removed formatting section (all fields use defaults)")
-        else:
-            new_data_source[key] = data_source[key]
-
-    # If formatting wasn't in original, add default_formatting at end
-    if 'formatting' not in data_source:
-        new_data_source['default_formatting'] = default_format
-
-    content['dashboard']['data_source'] = new_data_source
-
-    # Write back
+    # Write back (counted first, the round-trip edit removes fields in place)
+    field_count = len(formatting)
     if not dry_run:
-        with open(file_path, 'w') as f:
-            yaml.dump(content, f, default_flow_style=False, sort_keys=False, width=100000)
+        if yaml_rt is not None:
+            apply_round_trip(data_source, default_format, simplified_formatting)
+            write_round_trip(file_path, yaml_rt, content)
+        else:
+            dashboard['data_source'] = replace_formatting(data_source, default_format,
+                                                          simplified_formatting)
+            write_yaml(file_path, content)
         print(f"  ✅ Migrated to v1.3.0")
         print(f"     • Added default_formatting: {len(default_format)} properties")
-        print(f"     • Simplified formatting: {len(formatting)} → {len(simplified_formatting)} fields")
+        print(f"     • Simplified formatting: {field_count} → {len(simplified_formatting)} fields")
     else:
         print(f"  [DRY RUN] Would migrate:")
         print(f"     • Add default_formatting: {len(default_format)} properties")
-        print(f"     • Simplify formatting: {len(formatting)} → {len(simplified_formatting)} fields")
+        print(f"     • Simplify formatting: {field_count} → {len(simplified_formatting)} fields")
 
     return True
 
 
+def migrate_yaml_captured(file_path: Path, plan_entry: Optional[Dict] = None,
+                          dry_run: bool = False) -> Tuple[bool, str, Dict]:
+    """
+    Migrate a single YAML file, capturing its progress output
+    Returns (changed, output, plan_entry) so parallel runs can print without interleaving
+    """
+    plan_entry = dict(plan_entry or {})
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        changed = migrate_yaml(file_path, dry_run=dry_run, plan_entry=plan_entry)
+    return changed, buffer.getvalue(), plan_entry
+
+
+def load_plan(plan_path: str) -> Dict[str, Dict]:
+    """Load a plan written by --output-plan, keyed by resolved file path"""
+    with open(plan_path, 'r') as f:
+        return {entry['path']: entry for entry in json.load(f)}
+
+
+def save_plan(plan_path: str, entries: List[Dict]) -> None:
+    """Write analysed files' default_format/simplified_formatting as a JSON list"""
+    with open(plan_path, 'w') as f:
+        json.dump(entries, f, indent=2, ensure_ascii=False)
+
+
+def existing_paths(paths: List[Path]) -> List[Path]:
+    """
+    Filter paths to those that exist, listing each parent directory once
+    Avoids a stat() per file when the shell expands a large glob; names the
+    listing misses (e.g. other casings on case-insensitive filesystems) fall back to a stat
+    """
+    entries_by_dir: Dict[Path, set] = {}
+    for path in paths:
+        if path.parent in entries_by_dir:
+            continue
+        try:
+            with os.scandir(path.parent) as it:
+                entries_by_dir[path.parent] = {entry.name for entry in it}
+        except OSError:
+            entries_by_dir[path.parent] = set()
+
+    return [
+        path for path in paths
+        if path.name in entries_by_dir[path.parent] or os.path.exists(path)
+    ]
+
+
 def main():
     import argparse
 
     parser = argparse.ArgumentParser(description='Migrate DashSpec YAML files from v1.2 to v1.3')
     parser.add_argument('files', nargs='+', help='YAML files to migrate')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be changed without modifying files')
+    parser.add_argument('--output-plan', metavar='FILE', help='Save the computed formatting changes to a JSON plan')
+    parser.add_argument('--apply-plan', metavar='FILE', help='Reuse formatting changes from a JSON plan instead of re-analysing')
 
     args = parser.parse_args()
 
     changed_count = 0
 
-    for file_path in args.files:
-        path = Path(file_path)
-        if not path.exists():
-            print(f"⚠️  File not found: {file_path}")
-            continue
+    paths = [Path(file_path) for file_path in args.files]
+    existing = existing_paths(paths)
+    found = set(existing)
 
-        if migrate_yaml(path, dry_run=args.dry_run):
-            changed_count += 1
+    plan = load_plan(args.apply_plan) if args.apply_plan else {}
+    resolved = [str(path.resolve()) for path in existing]
+    plan_entries = [plan.get(key) for key in resolved]
+    new_plan = []
+
+    # Files are independent; migrate them in worker processes and print in input order
+    migrate = partial(migrate_yaml_captured, dry_run=args.dry_run)
+    if len(existing) > 1:
+        executor = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(existing)))
+        results = executor.map(migrate, existing, plan_entries)
+    else:
+        executor = None
+        results = map(migrate, existing, plan_entries)
+    resolved_by_path = dict(zip(existing, resolved))
+
+    try:
+        for file_path, path in zip(args.files, paths):
+            if path not in found:
+                print(f"⚠️  File not found: {file_path}")
+                continue
+
+            changed, output, plan_entry = next(results)
+            print(output, end='')
+            if changed:
+                changed_count += 1
+            if plan_entry:
+                new_plan.append({'path': resolved_by_path[path], **plan_entry})
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if args.output_plan:
+        save_plan(args.output_plan, new_plan)
 
     print(f"\n{'[DRY RUN] ' if args.dry_run else ''}Summary: {changed_count}/{len(args.files)} files processed")
 
@@ -16,8 +16,6 @@ import argparse
 import sys
 from pathlib import Path
 
-from dsl.renderers.streamlit.renderer import render_dashboard
-
 
 def main():
     parser = argparse.ArgumentParser(
@@ -33,6 +31,9 @@ def main():
         print(f"Error: Specification file not found: {spec_path}", file=sys.stderr)
         sys.exit(1)
 
+    # Imported here so --help and argument errors don't pay for loading Streamlit
+    from dsl.renderers.streamlit.renderer import render_dashboard
+
     # Render the dashboard
     render_dashboard(str(spec_path))
 
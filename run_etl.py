@@ -7,39 +7,106 @@ Kaggle datasets defined in config/datasets.yaml
 """
 
 import argparse
+import hashlib
+import json
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from etl.config import load_config
-from etl.pipeline import ETLPipeline
+if TYPE_CHECKING:
+    from etl.config import ETLConfig
+
+CONFIG_CACHE_DIR = Path.home() / ".cache" / "dashspec"
+
+# Module defining the cached config classes; editing it invalidates cached configs
+CONFIG_MODULE = Path(__file__).resolve().parent / "etl" / "config.py"
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# The log format doesn't use thread/process fields; skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+
+class LazyFileHandler(logging.FileHandler):
+    """FileHandler that creates its directory and opens the file on first emit"""
+
+    def __init__(self, filename: Path) -> None:
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
 
 
 def setup_logging(log_level: str = "INFO") -> None:
     """Configure logging"""
     log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-
-    # Create formatter
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    )
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
-    console_handler.setFormatter(formatter)
 
     # File handler
-    file_handler = logging.FileHandler(log_dir / "etl_pipeline.log")
+    file_handler = LazyFileHandler(log_dir / "etl_pipeline.log")
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
 
-    # Configure root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    # Configure root logger; both handlers share one formatter
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format=LOG_FORMAT,
+        datefmt=LOG_DATE_FORMAT,
+        handlers=[console_handler, file_handler],
+        force=True,
+    )
+
+
+def load_config_cached(config_path: str) -> "ETLConfig":
+    """
+    Load configuration, reusing a JSON copy while the YAML file is unchanged
+
+    Each config file has one cache entry, named after its resolved path and
+    holding the mtime and size of the file plus the mtime of etl/config.py.
+    Editing either the YAML or the config classes makes the entry stale, and
+    the next load overwrites it. Any problem reading or writing the cache
+    falls back to a normal parse.
+
+    Args:
+        config_path: Path to the YAML configuration file
+
+    Returns:
+        Parsed ETLConfig
+    """
+    from etl.config import ETLConfig, load_config
+
+    path = Path(config_path).resolve()
+    stat = path.stat()
+    key = [stat.st_mtime_ns, stat.st_size, CONFIG_MODULE.stat().st_mtime_ns]
+    cache_file = CONFIG_CACHE_DIR / f"config-{hashlib.sha1(str(path).encode()).hexdigest()}.json"
+
+    try:
+        entry = json.loads(cache_file.read_text())
+        if entry["key"] == key:
+            return ETLConfig.model_validate(entry["config"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    config = load_config(config_path)
+
+    try:
+        CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        entry = {"key": key, "config": config.model_dump(mode="json")}
+        cache_file.write_text(json.dumps(entry))
+        # Entries of the earlier pickle cache were keyed by content and never reused
+        for stale in CONFIG_CACHE_DIR.glob("config-*.pkl"):
+            stale.unlink(missing_ok=True)
+    except OSError as e:
+        logging.getLogger(__name__).debug("Could not cache configuration: %s", e)
+
+    return config
 
 
 def main():
@@ -90,11 +157,14 @@ Examples:
     logger = logging.getLogger(__name__)
 
     try:
+        # Imported here so --help and bad arguments don't load pandas/kaggle
+        from etl.pipeline import ETLPipeline
+
         # Load configuration
         logger.info("Loading configuration...")
-        config = load_config(args.config)
+        config = load_config_cached(args.config)
 
-        logger.info(f"Found {len(config.datasets)} datasets in configuration")
+        logger.info("Found %d datasets in configuration", len(config.datasets))
 
         # Create and run pipeline
         pipeline = ETLPipeline(config)
@@ -116,7 +186,7 @@ Examples:
         sys.exit(130)
 
     except Exception as e:
-        logger.error(f"Pipeline failed: {e}", exc_info=True)
+        logger.error("Pipeline failed: %s", e, exc_info=True)
         sys.exit(1)
 
 
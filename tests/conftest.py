@@ -0,0 +1,177 @@
+"""
+Shared fixtures for the DashSpec test suite
+"""
+
+import json
+import os
+import re
+from collections import namedtuple
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import pytest
+import yaml
+
+from dsl.core.adapter import build_ir, validate
+
+# libyaml-backed loader when available; same results as yaml.safe_load
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Document markers/directives at line start; specs containing them can't be
+# concatenated into one multi-document stream
+DOCUMENT_MARKER = re.compile(r"^(?:---|\.\.\.|%)", re.MULTILINE)
+
+# Example specs that are test fixtures rather than production dashboards
+EXCLUDED_SPECS = frozenset(
+    {"failing.yaml", "happy_path.yaml", "minimal.yaml", "enhanced_fraud_analysis.yaml"}
+)
+
+# All v1.2 dashboard specifications, globbed once at import
+SPEC_PATHS = tuple(
+    str(p) for p in sorted(Path("dsl/examples").glob("*.yaml")) if p.name not in EXCLUDED_SPECS
+)
+
+# Sections of a spec the tests inspect, extracted once per spec; missing
+# metadata/pages default to empty, the rest to None. violations and ir are the
+# validate()/build_ir() results (ir is None when validation fails)
+SpecView = namedtuple(
+    "SpecView",
+    "path metadata data_source formatting column_labels dq_rules pages data_path violations ir",
+)
+
+
+def pytest_generate_tests(metafunc):
+    """Run tests that take a spec_path once per dashboard specification"""
+    if "spec_path" in metafunc.fixturenames:
+        metafunc.parametrize("spec_path", SPEC_PATHS, ids=lambda p: Path(p).name)
+
+
+@pytest.fixture(scope="session")
+def dashboard_specs() -> Tuple[str, ...]:
+    """Get all v1.2 dashboard specifications"""
+    return SPEC_PATHS
+
+
+def read_cached_spec(spec_path: str, cache_dir: Path) -> Optional[Dict]:
+    """Return the JSON copy of a spec from cache_dir if it is at least as new as the YAML"""
+    cache_path = cache_dir / f"{Path(spec_path).stem}.json"
+    try:
+        if cache_path.stat().st_mtime_ns >= Path(spec_path).stat().st_mtime_ns:
+            with open(cache_path) as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def write_cached_spec(spec_path: str, spec: Dict, cache_dir: Path) -> None:
+    """
+    Store a JSON copy of a parsed spec in cache_dir
+
+    Specs that don't survive a JSON round trip unchanged (dates, non-string keys)
+    are never cached.
+    """
+    try:
+        encoded = json.dumps(spec)
+    except (TypeError, ValueError):
+        return
+    if json.loads(encoded) != spec:
+        return
+
+    # Write then rename so parallel workers never read a partial file
+    cache_path = cache_dir / f"{Path(spec_path).stem}.json"
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(encoded)
+    os.replace(tmp_path, cache_path)
+
+
+def parse_specs(spec_paths: List[str]) -> List[Dict]:
+    """
+    Parse YAML specs as one multi-document stream, amortising loader setup
+
+    Falls back to one parse per file when a spec has its own document markers or
+    directives, or when the combined stream fails to parse (so errors name the file).
+    """
+    texts = [Path(spec_path).read_text() for spec_path in spec_paths]
+    if len(texts) > 1 and not any(DOCUMENT_MARKER.search(text) for text in texts):
+        try:
+            docs = list(yaml.load_all("\n---\n".join(texts), Loader=Loader))
+        except yaml.YAMLError:
+            docs = []
+        if len(docs) == len(texts):
+            return docs
+    return [yaml.load(text, Loader=Loader) for text in texts]
+
+
+@pytest.fixture(scope="session")
+def parsed_specs(dashboard_specs, request) -> Dict[str, Dict]:
+    """Parse each dashboard specification once per test session, cached as JSON across runs"""
+    cache = getattr(request.config, "cache", None)
+    cache_dir = cache.mkdir("specs") if cache is not None else None
+
+    specs = {}
+    if cache_dir is not None:
+        for spec_path in dashboard_specs:
+            cached = read_cached_spec(spec_path, cache_dir)
+            if cached is not None:
+                specs[spec_path] = cached
+
+    misses = [spec_path for spec_path in dashboard_specs if spec_path not in specs]
+    for spec_path, spec in zip(misses, parse_specs(misses)):
+        specs[spec_path] = spec
+        if cache_dir is not None:
+            write_cached_spec(spec_path, spec, cache_dir)
+
+    return {spec_path: specs[spec_path] for spec_path in dashboard_specs}
+
+
+@pytest.fixture
+def spec(spec_path, parsed_specs) -> Dict:
+    """Parsed specification for the current spec_path parameter"""
+    return parsed_specs[spec_path]
+
+
+def make_spec_view(spec_path: str, spec: Dict) -> SpecView:
+    """Extract the sections the tests inspect from a parsed spec, validating it once"""
+    dashboard = spec.get("dashboard", {})
+    data_source = dashboard.get("data_source", {})
+    violations = validate(spec)
+    return SpecView(
+        path=spec_path,
+        metadata=dashboard.get("metadata", {}),
+        data_source=data_source,
+        formatting=data_source.get("formatting"),
+        column_labels=data_source.get("column_labels"),
+        dq_rules=data_source.get("data_quality"),
+        pages=dashboard.get("pages", []),
+        data_path=data_source.get("path"),
+        violations=violations,
+        ir=build_ir(spec) if not violations else None,
+    )
+
+
+@pytest.fixture(scope="session")
+def spec_views(parsed_specs) -> Dict[str, SpecView]:
+    """SpecView for each dashboard specification"""
+    return {spec_path: make_spec_view(spec_path, spec) for spec_path, spec in parsed_specs.items()}
+
+
+@pytest.fixture
+def view(spec_path, spec_views) -> SpecView:
+    """SpecView for the current spec_path parameter"""
+    return spec_views[spec_path]
+
+
+@pytest.fixture(scope="session")
+def existing_data_files(spec_views) -> Set[str]:
+    """Paths of the files present in each directory referenced by a spec's data_source"""
+    data_dirs = {os.path.dirname(view.data_path) for view in spec_views.values() if view.data_path}
+
+    existing = set()
+    for data_dir in data_dirs:
+        try:
+            with os.scandir(data_dir or ".") as entries:
+                existing.update(os.path.join(data_dir, entry.name) for entry in entries)
+        except OSError:
+            pass
+    return existing
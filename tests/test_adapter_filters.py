@@ -0,0 +1,80 @@
+"""
+Test suite for page filter evaluation in the DSL adapter
+
+Tests:
+- Combined filter mask matches filtering one predicate at a time
+- Inactive and malformed filters are ignored
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dsl.core.adapter import _filter_mask
+
+FILTERS = [
+    {"id": "price", "field": "price", "type": "range"},
+    {"id": "region", "field": "region", "type": "select"},
+    {"id": "segments", "field": "segment", "type": "multiselect"},
+]
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    """Frame with missing values in every filtered column"""
+    rng = np.random.default_rng(0)
+    n = 2000
+    price = rng.uniform(0, 100, n)
+    price[::50] = np.nan
+    return pd.DataFrame(
+        {
+            "price": price,
+            "region": pd.Categorical(rng.choice(["north", "south", None], n)),
+            "segment": rng.choice(["a", "b", "c", None], n),
+        }
+    )
+
+
+def filter_one_by_one(df: pd.DataFrame, values: dict) -> pd.DataFrame:
+    """Apply each filter to the already-filtered frame in turn"""
+    if "price" in values:
+        low, high = values["price"]
+        df = df[(df["price"] >= low) & (df["price"] <= high)]
+    if "region" in values:
+        df = df[df["region"] == values["region"]]
+    if "segments" in values:
+        df = df[df["segment"].isin(values["segments"])]
+    return df
+
+
+class TestFilterMask:
+    """Test _filter_mask"""
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            {"price": [20, 60]},
+            {"region": "north"},
+            {"segments": ["a", "c"]},
+            {"price": (10.5, 90), "region": "south", "segments": ["b"]},
+        ],
+    )
+    def test_matches_sequential_filtering(self, df, values):
+        """One combined mask selects the same rows as chained filters"""
+        mask = _filter_mask(df, FILTERS, values)
+
+        assert mask.dtype == bool
+        pd.testing.assert_frame_equal(df[mask], filter_one_by_one(df, values))
+
+    def test_no_active_filters(self, df):
+        """No filter values means no mask"""
+        assert _filter_mask(df, FILTERS, {}) is None
+
+    def test_malformed_and_unknown_filters_ignored(self, df):
+        """Ranges without two bounds and unknown filter types are skipped"""
+        filters = FILTERS + [{"id": "day", "field": "price", "type": "date_range"}]
+        values = {"price": [10], "day": ["2024-01-01", "2024-02-01"], "region": "north"}
+
+        mask = _filter_mask(df, filters, values)
+
+        pd.testing.assert_frame_equal(df[mask], filter_one_by_one(df, {"region": "north"}))
@@ -11,17 +11,16 @@ Tests:
 - v1.2-specific features
 """
 
+import importlib
 import json
-import warnings
 from pathlib import Path
-from typing import Dict, List
 
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
-import yaml
 
-from dsl.core.adapter import parse, validate, build_ir, execute
+from dsl.core.adapter import execute
 from dsl.core.data_quality import DataQualityProcessor
 from dsl.core.formatting import format_number, get_currency_symbol
 
@@ -29,156 +28,87 @@ from dsl.core.formatting import format_number, get_currency_symbol
 class TestDashboardV12Validation:
     """Test v1.2 dashboard specification validation"""
 
-    @pytest.fixture
-    def dashboard_specs(self) -> List[str]:
-        """Get all v1.2 dashboard specifications"""
-        spec_dir = Path("dsl/examples")
-        # Get all production dashboards (exclude test files)
-        all_specs = list(spec_dir.glob("*.yaml"))
-        exclude = {"failing.yaml", "happy_path.yaml", "minimal.yaml", "enhanced_fraud_analysis.yaml"}
-        return [str(f) for f in all_specs if f.name not in exclude]
-
     def test_all_v12_dashboards_exist(self, dashboard_specs):
         """Verify all expected v1.2 dashboards exist"""
         assert len(dashboard_specs) >= 10, f"Expected at least 10 v1.2 dashboards, found {len(dashboard_specs)}"
 
-    def test_dashboard_specs_valid_yaml(self, dashboard_specs):
-        """Test that all dashboards are valid YAML"""
-        for spec_path in dashboard_specs:
-            with open(spec_path) as f:
-                spec = yaml.safe_load(f)
-            assert isinstance(spec, dict), f"{spec_path} is not a valid YAML dict"
-            assert "dashboard" in spec, f"{spec_path} missing 'dashboard' key"
-
-    def test_dashboard_validation_passes(self, dashboard_specs):
-        """Test that all dashboards pass DSL validation"""
-        failed = []
-        for spec_path in dashboard_specs:
-            with open(spec_path) as f:
-                spec = yaml.safe_load(f)
-
-            violations = validate(spec)
-            if violations:
-                failed.append((spec_path, violations))
-
-        if failed:
-            msg = "\n".join([
-                f"{path}: {[v['message'] for v in viols]}" for path, viols in failed
-            ])
-            pytest.fail(f"Dashboards failed validation:\n{msg}")
-
-    def test_dashboard_version(self, dashboard_specs):
-        """Test that all dashboards use v1.2"""
-        for spec_path in dashboard_specs:
-            with open(spec_path) as f:
-                spec = yaml.safe_load(f)
-
-            version = spec.get("dsl_version")
-            assert version == "1.2.0", f"{spec_path} using version {version}, expected 1.2.0"
-
-    def test_dashboard_has_pages(self, dashboard_specs):
-        """Test that all dashboards have at least one page"""
-        for spec_path in dashboard_specs:
-            with open(spec_path) as f:
-                spec = yaml.safe_load(f)
-
-            pages = spec.get("dashboard", {}).get("pages", [])
-            assert len(pages) >= 1, f"{spec_path} has no pages"
-
-
-class TestV12Metadata:
-    """Test v1.2 metadata enhancements"""
-
-    @pytest.fixture
-    def dashboard_specs(self) -> List[str]:
-        """Get all v1.2 dashboard specifications"""
-        spec_dir = Path("dsl/examples")
-        # Get all production dashboards (exclude test files)
-        all_specs = list(spec_dir.glob("*.yaml"))
-        exclude = {"failing.yaml", "happy_path.yaml", "minimal.yaml", "enhanced_fraud_analysis.yaml"}
-        return [str(f) for f in all_specs if f.name not in exclude]
-
-    def test_metadata_has_currency(self, dashboard_specs):
-        """Test that all dashboards specify currency"""
-        for spec_path in dashboard_specs:
-            with open(spec_path) as f:
-                spec = yaml.safe_load(f)
-
-            metadata = spec.get("dashboard", {}).get("metadata", {})
-            assert "currency" in metadata, f"{spec_path} missing currency in metadata"
-            assert isinstance(metadata["currency"], str), f"{spec_path} currency should be string"
-            assert len(metadata["currency"]) == 3, f"{spec_path} currency should be 3-letter ISO code"
-
-    def test_metadata_has_narrative(self, dashboard_specs):
-        """Test that all dashboards have narrative"""
-        for spec_path in dashboard_specs:
-            with open(spec_path) as f:
-                spec = yaml.safe_load(f)
-
-            metadata = spec.get("dashboard", {}).get("metadata", {})
-            assert "narrative" in metadata, f"{spec_path} missing narrative in metadata"
+    def test_spec_invariants(self, spec_path, spec, view):
+        """
+        Test the structural invariants every v1.2 dashboard must satisfy
+
+        All checks run before reporting, so one broken invariant doesn't hide the rest.
+        """
+        failures = []
+
+        def check(condition: bool, message: str) -> None:
+            if not condition:
+                failures.append(message)
+
+        # Valid YAML on v1.2
+        check(isinstance(spec, dict), "is not a valid YAML dict")
+        check("dashboard" in spec, "missing 'dashboard' key")
+        version = spec.get("dsl_version")
+        check(version == "1.2.0", f"using version {version}, expected 1.2.0")
+
+        # Metadata: all recommended fields, ISO currency, descriptive narrative
+        metadata = view.metadata
+        for field in ["dataset_name", "description", "currency", "narrative"]:
+            check(field in metadata, f"missing {field} in metadata")
+        if "currency" in metadata:
+            currency = metadata["currency"]
+            check(isinstance(currency, str), "currency should be string")
+            check(isinstance(currency, str) and len(currency) == 3, "currency should be 3-letter ISO code")
+        if "narrative" in metadata:
             narrative = metadata["narrative"]
-            assert isinstance(narrative, str), f"{spec_path} narrative should be string"
-            assert len(narrative) > 50, f"{spec_path} narrative should be descriptive (>50 chars)"
-
-    def test_metadata_structure_complete(self, dashboard_specs):
-        """Test that metadata has all recommended fields"""
-        required_fields = ["dataset_name", "description", "currency", "narrative"]
-        for spec_path in dashboard_specs:
-            with open(spec_path) as f:
-                spec = yaml.safe_load(f)
+            check(isinstance(narrative, str), "narrative should be string")
+            check(isinstance(narrative, str) and len(narrative) > 50, "narrative should be descriptive (>50 chars)")
 
-            metadata = spec.get("dashboard", {}).get("metadata", {})
-            for field in required_fields:
-                assert field in metadata, f"{spec_path} missing {field} in metadata"
+        # Formatting rules and column labels
+        valid_types = ["integer", "number", "currency", "percent"]
+        formatting = view.formatting
+        check(formatting is not None, "missing formatting rules")
+        if formatting is not None:
+            check(isinstance(formatting, dict), "formatting should be dict")
+        for field, fmt in (formatting or {}).items():
+            check("type" in fmt, f"field {field} missing type")
+            if "type" in fmt:
+                check(fmt["type"] in valid_types, f"invalid format type: {fmt['type']}")
+
+        column_labels = view.column_labels
+        check(column_labels is not None, "missing column_labels")
+        if column_labels is not None:
+            check(isinstance(column_labels, dict), "column_labels should be dict")
+
+        # Data quality rules
+        required_sections = ["missing_values", "duplicates", "outliers", "validation", "reporting"]
+        dq_rules = view.dq_rules
+        check(dq_rules is not None, "missing data_quality rules")
+        for section in required_sections:
+            check(section in (dq_rules or {}), f"missing DQ section: {section}")
+
+        # Pages: all v1.2 dashboards should have 4-5 pages with unique ids and titles
+        pages = view.pages
+        check(len(pages) >= 1, "has no pages")
+        check(len(pages) >= 4, f"should have at least 4 pages, has {len(pages)}")
+        page_ids = [p.get("id") for p in pages]
+        check(len(page_ids) == len(set(page_ids)), "has duplicate page IDs")
+        for idx, page in enumerate(pages):
+            check("title" in page, f"page {idx} missing title")
+            check(len(page.get("title", "")) > 0, f"page {idx} has empty title")
+
+        if failures:
+            pytest.fail(f"{spec_path} violates {len(failures)} invariant(s):\n" + "\n".join(f"  - {m}" for m in failures))
+
+    def test_dashboard_validation_passes(self, spec_path, view):
+        """Test that all dashboards pass DSL validation"""
+        violations = view.violations
+        if violations:
+            pytest.fail(f"Dashboard failed validation:\n{spec_path}: {[v['message'] for v in violations]}")
 
 
 class TestFormattingSpecifications:
     """Test v1.2 formatting specifications"""
 
-    @pytest.fixture
-    def dashboard_specs(self) -> List[str]:
-        """Get all v1.2 dashboard specifications"""
-        spec_dir = Path("dsl/examples")
-        # Get all production dashboards (exclude test files)
-        all_specs = list(spec_dir.glob("*.yaml"))
-        exclude = {"failing.yaml", "happy_path.yaml", "minimal.yaml", "enhanced_fraud_analysis.yaml"}
-        return [str(f) for f in all_specs if f.name not in exclude]
-
-    def test_formatting_rules_exist(self, dashboard_specs):
-        """Test that dashboards have formatting rules"""
-        for spec_path in dashboard_specs:
-            with open(spec_path) as f:
-                spec = yaml.safe_load(f)
-
-            data_source = spec.get("dashboard", {}).get("data_source", {})
-            formatting = data_source.get("formatting")
-            assert formatting is not None, f"{spec_path} missing formatting rules"
-            assert isinstance(formatting, dict), f"{spec_path} formatting should be dict"
-
-    def test_formatting_rules_valid(self, dashboard_specs):
-        """Test that formatting rules are valid"""
-        valid_types = ["integer", "number", "currency", "percent"]
-        for spec_path in dashboard_specs:
-            with open(spec_path) as f:
-                spec = yaml.safe_load(f)
-
-            formatting = spec.get("dashboard", {}).get("data_source", {}).get("formatting", {})
-            for field, fmt in formatting.items():
-                assert "type" in fmt, f"{spec_path} field {field} missing type"
-                assert fmt["type"] in valid_types, f"{spec_path} invalid format type: {fmt['type']}"
-
-    def test_column_labels_exist(self, dashboard_specs):
-        """Test that dashboards have column labels"""
-        for spec_path in dashboard_specs:
-            with open(spec_path) as f:
-                spec = yaml.safe_load(f)
-
-            data_source = spec.get("dashboard", {}).get("data_source", {})
-            column_labels = data_source.get("column_labels")
-            assert column_labels is not None, f"{spec_path} missing column_labels"
-            assert isinstance(column_labels, dict), f"{spec_path} column_labels should be dict"
-
     def test_format_number_function(self):
         """Test format_number utility function"""
         # Test currency formatting
@@ -204,36 +134,6 @@ class TestFormattingSpecifications:
 class TestDataQualityRules:
     """Test v1.2 data quality specifications and processing"""
 
-    @pytest.fixture
-    def dashboard_specs(self) -> List[str]:
-        """Get all v1.2 dashboard specifications"""
-        spec_dir = Path("dsl/examples")
-        # Get all production dashboards (exclude test files)
-        all_specs = list(spec_dir.glob("*.yaml"))
-        exclude = {"failing.yaml", "happy_path.yaml", "minimal.yaml", "enhanced_fraud_analysis.yaml"}
-        return [str(f) for f in all_specs if f.name not in exclude]
-
-    def test_dq_rules_exist(self, dashboard_specs):
-        """Test that dashboards have data quality rules"""
-        for spec_path in dashboard_specs:
-            with open(spec_path) as f:
-                spec = yaml.safe_load(f)
-
-            data_source = spec.get("dashboard", {}).get("data_source", {})
-            dq_rules = data_source.get("data_quality")
-            assert dq_rules is not None, f"{spec_path} missing data_quality rules"
-
-    def test_dq_structure_valid(self, dashboard_specs):
-        """Test that DQ rules have valid structure"""
-        required_sections = ["missing_values", "duplicates", "outliers", "validation", "reporting"]
-        for spec_path in dashboard_specs:
-            with open(spec_path) as f:
-                spec = yaml.safe_load(f)
-
-            dq_rules = spec.get("dashboard", {}).get("data_source", {}).get("data_quality", {})
-            for section in required_sections:
-                assert section in dq_rules, f"{spec_path} missing DQ section: {section}"
-
     def test_dq_processor_initialization(self):
         """Test that DataQualityProcessor can be initialized"""
         dq_rules = {
@@ -247,11 +147,13 @@ class TestDataQualityRules:
         assert processor is not None
         assert processor.rules == dq_rules
 
+    @pytest.mark.filterwarnings("ignore")
     def test_dq_processor_handles_outliers(self):
         """Test outlier detection and capping"""
         # Create test data with outliers
         df = pd.DataFrame({
-            "value": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 100, 200]  # 100, 200 are clear outliers
+            # 100, 200 are clear outliers
+            "value": np.concatenate([np.arange(1, 11, dtype=np.int64), np.array([100, 200], dtype=np.int64)])
         })
 
         dq_rules = {
@@ -272,19 +174,18 @@ class TestDataQualityRules:
         }
 
         processor = DataQualityProcessor(dq_rules)
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            result_df, report = processor.process(df)
+        result_df, report = processor.process(df)
 
         # Check that extreme outliers (200) were capped - 90th percentile is around 10-91
         assert result_df["value"].max() <= 100, f"Extreme outliers should be capped, got max={result_df['value'].max()}"
         assert result_df["value"].max() < 200, "200 should be capped below its original value"
         assert report["outliers_detected"] > 0, "Should detect outliers"
 
+    @pytest.mark.filterwarnings("ignore")
     def test_dq_processor_handles_missing_values(self):
         """Test missing value handling"""
         df = pd.DataFrame({
-            "value": [1, 2, np.nan, 4, np.nan, 6]
+            "value": np.array([1, 2, np.nan, 4, np.nan, 6], dtype=np.float64)
         })
 
         dq_rules = {
@@ -302,150 +203,85 @@ class TestDataQualityRules:
         }
 
         processor = DataQualityProcessor(dq_rules)
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            result_df, report = processor.process(df)
+        result_df, report = processor.process(df)
 
         # Check that NaN rows were dropped
         assert len(result_df) == 4, "Should drop rows with NaN"
         assert result_df["value"].isna().sum() == 0, "No NaN values should remain"
 
 
-class TestMultiPageNavigation:
-    """Test multi-page dashboard features"""
-
-    @pytest.fixture
-    def dashboard_specs(self) -> List[str]:
-        """Get all v1.2 dashboard specifications"""
-        spec_dir = Path("dsl/examples")
-        # Get all production dashboards (exclude test files)
-        all_specs = list(spec_dir.glob("*.yaml"))
-        exclude = {"failing.yaml", "happy_path.yaml", "minimal.yaml", "enhanced_fraud_analysis.yaml"}
-        return [str(f) for f in all_specs if f.name not in exclude]
-
-    def test_all_dashboards_have_multiple_pages(self, dashboard_specs):
-        """Test that v1.2 dashboards have multiple pages"""
-        for spec_path in dashboard_specs:
-            with open(spec_path) as f:
-                spec = yaml.safe_load(f)
-
-            pages = spec.get("dashboard", {}).get("pages", [])
-            # All v1.2 dashboards should have 4-5 pages
-            assert len(pages) >= 4, f"{spec_path} should have at least 4 pages, has {len(pages)}"
-
-    def test_page_ids_unique(self, dashboard_specs):
-        """Test that page IDs are unique within each dashboard"""
-        for spec_path in dashboard_specs:
-            with open(spec_path) as f:
-                spec = yaml.safe_load(f)
-
-            pages = spec.get("dashboard", {}).get("pages", [])
-            page_ids = [p.get("id") for p in pages]
-            assert len(page_ids) == len(set(page_ids)), f"{spec_path} has duplicate page IDs"
-
-    def test_pages_have_titles(self, dashboard_specs):
-        """Test that all pages have titles"""
-        for spec_path in dashboard_specs:
-            with open(spec_path) as f:
-                spec = yaml.safe_load(f)
-
-            pages = spec.get("dashboard", {}).get("pages", [])
-            for idx, page in enumerate(pages):
-                assert "title" in page, f"{spec_path} page {idx} missing title"
-                assert len(page["title"]) > 0, f"{spec_path} page {idx} has empty title"
-
-
 class TestDataAvailability:
     """Test that data files are available"""
 
-    @pytest.fixture
-    def dashboard_specs(self) -> List[str]:
-        """Get all v1.2 dashboard specifications"""
-        spec_dir = Path("dsl/examples")
-        # Get all production dashboards (exclude test files)
-        all_specs = list(spec_dir.glob("*.yaml"))
-        exclude = {"failing.yaml", "happy_path.yaml", "minimal.yaml", "enhanced_fraud_analysis.yaml"}
-        return [str(f) for f in all_specs if f.name not in exclude]
-
-    def test_data_files_exist(self, dashboard_specs):
+    def test_data_files_exist(self, spec_path, view, existing_data_files):
         """Test that all referenced data files exist"""
-        missing = []
-        for spec_path in dashboard_specs:
-            with open(spec_path) as f:
-                spec = yaml.safe_load(f)
-
-            data_path = spec.get("dashboard", {}).get("data_source", {}).get("path")
-            if data_path and not Path(data_path).exists():
-                missing.append((spec_path, data_path))
-
-        if missing:
-            msg = "\n".join([f"{spec}: {data}" for spec, data in missing])
-            pytest.fail(f"Missing data files:\n{msg}")
+        data_path = view.data_path
+        if data_path and data_path not in existing_data_files:
+            pytest.fail(f"Missing data file:\n{spec_path}: {data_path}")
 
-    def test_data_files_readable(self, dashboard_specs):
+    def test_data_files_readable(self, spec_path, view, existing_data_files):
         """Test that all data files can be read"""
-        for spec_path in dashboard_specs:
-            with open(spec_path) as f:
-                spec = yaml.safe_load(f)
-
-            data_path = spec.get("dashboard", {}).get("data_source", {}).get("path")
-            if data_path and Path(data_path).exists():
-                try:
-                    df = pd.read_parquet(data_path)
-                    assert len(df) > 0, f"Empty dataframe: {data_path}"
-                except Exception as e:
-                    pytest.fail(f"Cannot read {data_path}: {e}")
+        data_path = view.data_path
+        if data_path and data_path in existing_data_files:
+            try:
+                # Row counts come from Parquet footers; no column data is decoded.
+                # Partitioned outputs are directories, counted per fragment
+                if Path(data_path).is_dir():
+                    dataset = pq.ParquetDataset(data_path)
+                    num_rows = sum(fragment.count_rows() for fragment in dataset.fragments)
+                else:
+                    num_rows = pq.ParquetFile(data_path).metadata.num_rows
+                assert num_rows > 0, f"Empty dataframe: {data_path}"
+            except Exception as e:
+                pytest.fail(f"Cannot read {data_path}: {e}")
 
 
 class TestIntegrationV12:
     """Integration tests for v1.2 features"""
 
-    def test_full_pipeline_execution(self):
+    @pytest.mark.filterwarnings("ignore")
+    def test_full_pipeline_execution(self, spec_views):
         """Test complete pipeline: parse → validate → build IR → execute"""
         spec_path = "dsl/examples/fraud_detection.yaml"
 
-        if not Path(spec_path).exists():
+        if spec_path not in spec_views:
             pytest.skip(f"Test spec not found: {spec_path}")
 
-        # Parse
-        with open(spec_path) as f:
-            spec = yaml.safe_load(f)
+        # Parse, validate and build IR happen once per session in spec_views
+        view = spec_views[spec_path]
 
         # Validate
-        violations = validate(spec)
-        assert len(violations) == 0, f"Validation errors: {violations}"
+        assert len(view.violations) == 0, f"Validation errors: {view.violations}"
 
         # Build IR
-        ir = build_ir(spec)
+        ir = view.ir
         assert ir is not None
         assert ir["version"] == "1.2.0"
 
         # Execute (if data available)
-        data_path = spec.get("dashboard", {}).get("data_source", {}).get("path")
+        data_path = view.data_path
         if Path(data_path).exists():
             inputs = {"filters": {}}
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                results = execute(ir, inputs)
+            results = execute(ir, inputs)
 
             assert "pages" in results
             assert len(results["pages"]) > 0
 
-    def test_renderer_initialization_with_tabs(self):
-        """Test that StreamlitRenderer can be initialized with tabs"""
+    @pytest.fixture(params=[False, True], ids=["standalone", "gallery"])
+    def renderer(self, request, parsed_specs):
+        """StreamlitRenderer for the fraud dashboard, reusing the session-parsed spec"""
         from dsl import StreamlitRenderer
 
         spec_path = "dsl/examples/fraud_detection.yaml"
-        if not Path(spec_path).exists():
+        if spec_path not in parsed_specs:
             pytest.skip(f"Test spec not found: {spec_path}")
 
-        # Test with tabs=False (standalone)
-        renderer_standalone = StreamlitRenderer(spec_path, use_tabs=False)
-        assert renderer_standalone.use_tabs is False
+        return StreamlitRenderer(spec_path, use_tabs=request.param, spec=parsed_specs[spec_path])
 
-        # Test with tabs=True (gallery)
-        renderer_gallery = StreamlitRenderer(spec_path, use_tabs=True)
-        assert renderer_gallery.use_tabs is True
+    def test_renderer_initialization_with_tabs(self, renderer, request):
+        """Test that StreamlitRenderer can be initialized with tabs"""
+        # use_tabs=False is standalone, use_tabs=True is the gallery
+        assert renderer.use_tabs is request.node.callspec.params["renderer"]
 
 
 def test_app_imports_successfully():
@@ -467,12 +303,15 @@ def test_all_modules_importable():
         "dsl.core.data_loader"
     ]
 
+    # Modules already loaded through the dsl package imports above come straight
+    # from sys.modules; any others are imported for real, so import-time errors fail
     for module in modules:
         try:
-            __import__(module)
+            importlib.import_module(module)
         except ImportError as e:
             pytest.fail(f"Cannot import {module}: {e}")
 
 
 # Run with: pytest tests/test_dashboards_v12.py -v
 # Run with coverage: pytest tests/test_dashboards_v12.py --cov=dsl --cov-report=html
+# Run in parallel (pytest-xdist): pytest tests/test_dashboards_v12.py -n auto
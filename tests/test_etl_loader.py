@@ -0,0 +1,178 @@
+"""
+Test suite for the ETL Parquet loader
+
+Tests:
+- Parquet writes round-trip data across row groups
+- Metadata JSON with NumPy scalars
+- Parquet info read from footers, for files and partitioned directories
+- Resolved output paths refresh after a rewrite
+- Column encodings
+- Loaded dtypes, NumPy by default or Arrow-backed on request
+- Dataset fields stored as Parquet footer metadata
+- Per-file profiles merged into dataset metadata
+"""
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from etl import loader as loader_module
+from etl.loader import ParquetLoader
+
+
+@pytest.fixture
+def loader(tmp_path) -> ParquetLoader:
+    """Loader writing into a temporary directory"""
+    processed_dir = tmp_path / "processed"
+    metadata_dir = tmp_path / "metadata"
+    processed_dir.mkdir()
+    metadata_dir.mkdir()
+    return ParquetLoader(processed_dir, metadata_dir)
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    """Mixed-dtype frame with nulls"""
+    n = 1000
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "id": np.arange(n),
+            "amount": rng.normal(100, 10, n),
+            "region": rng.choice(["north", "south", "east"], n),
+            "note": ["a", None] * (n // 2),
+            "day": pd.date_range("2024-01-01", periods=n, freq="h"),
+        }
+    )
+
+
+class TestSaveToParquet:
+    """Test ParquetLoader.save_to_parquet"""
+
+    def test_round_trip_across_row_groups(self, loader, df, monkeypatch):
+        """Data written in several row groups reads back unchanged"""
+        monkeypatch.setattr(loader_module, "ROW_GROUP_SIZE", 300)
+
+        path = loader.save_to_parquet(df, "sales")
+
+        assert pq.ParquetFile(path).num_row_groups == 4
+        pd.testing.assert_frame_equal(pd.read_parquet(path), df)
+
+    def test_empty_frame(self, loader, df):
+        """An empty frame writes a readable file with the full schema"""
+        path = loader.save_to_parquet(df.iloc[:0], "empty")
+
+        table = pq.read_table(path)
+
+        assert table.num_rows == 0
+        assert table.column_names == list(df.columns)
+
+    def test_column_encodings(self, loader, df):
+        """Floats use byte-stream-split, other columns are dictionary encoded"""
+        path = loader.save_to_parquet(df, "sales")
+        row_group = pq.ParquetFile(path).metadata.row_group(0)
+        encodings = {
+            row_group.column(i).path_in_schema: row_group.column(i).encodings
+            for i in range(row_group.num_columns)
+        }
+
+        assert row_group.column(0).compression == "ZSTD"
+        assert "BYTE_STREAM_SPLIT" in encodings["amount"]
+        assert "RLE_DICTIONARY" in encodings["region"]
+
+    def test_file_metadata_round_trip(self, loader, df):
+        """Footer metadata is stored alongside the pandas schema entry"""
+        loader.save_to_parquet(df, "sales", file_metadata={"source": "sales.csv", "rows": 1000})
+
+        assert loader.read_file_metadata("sales") == {"source": "sales.csv", "rows": "1000"}
+        assert list(loader.load_parquet("sales").columns) == list(df.columns)
+
+    def test_load_dtypes(self, loader, df):
+        """Loads use NumPy dtypes unless Arrow-backed dtypes are requested"""
+        loader.save_to_parquet(df, "sales")
+
+        default = loader.load_parquet("sales")
+        arrow = loader.load_parquet("sales", arrow_dtypes=True)
+
+        pd.testing.assert_series_equal(default.dtypes, df.dtypes)
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in arrow.dtypes)
+
+    def test_partitioned_file_metadata(self, loader, df):
+        """Partitioned outputs carry the footer metadata too"""
+        loader.save_to_parquet(
+            df, "sales", partition_cols=["region"], file_metadata={"source": "sales.csv"}
+        )
+
+        assert loader.read_file_metadata("sales") == {"source": "sales.csv"}
+
+
+class TestGetParquetInfo:
+    """Test ParquetLoader.get_parquet_info"""
+
+    def test_single_file(self, loader, df):
+        """Rows, columns and dtypes come from the footer"""
+        loader.save_to_parquet(df, "sales")
+
+        info = loader.get_parquet_info("sales")
+
+        assert info["exists"] is True
+        assert info["rows"] == len(df)
+        assert info["columns"] == len(df.columns)
+        assert info["size_mb"] > 0
+        assert info["dtypes"] == df.dtypes.astype(str).to_dict()
+
+    def test_partitioned_directory(self, loader, df):
+        """Partitioned outputs are counted from their fragments' footers"""
+        path = loader.save_to_parquet(df, "sales", partition_cols=["region"])
+
+        info = loader.get_parquet_info("sales")
+
+        assert path.is_dir()
+        assert info["rows"] == len(df)
+        assert info["size_mb"] is None
+
+    def test_missing_output(self, loader):
+        """Parquet info for an unknown dataset reports it as missing"""
+        info = loader.get_parquet_info("missing")
+
+        assert info["exists"] is False
+        assert "error" in info
+
+    def test_rewrite_refreshes_resolved_path(self, loader, df):
+        """Saving again drops the cached (path, size) entry"""
+        loader.save_to_parquet(df.head(10), "sales")
+        small = loader.get_parquet_info("sales")["size_mb"]
+
+        loader.save_to_parquet(df, "sales")
+
+        assert loader.get_parquet_info("sales")["size_mb"] > small
+
+
+class TestMetadata:
+    """Test metadata and profile JSON files"""
+
+    def test_numpy_scalars_serialized(self, loader):
+        """NumPy scalars from profiles are written as plain JSON numbers"""
+        profile = {"rows": np.int64(1000), "mean": np.float64(1.5), "flag": np.bool_(True)}
+
+        loader.save_metadata({"name": "sales"}, "sales", profile=profile)
+
+        assert loader.load_metadata("sales") == {
+            "name": "sales",
+            "data_profile": {"rows": 1000, "mean": 1.5, "flag": True},
+        }
+
+    def test_profile_merged_into_dataset_metadata(self, loader):
+        """load_metadata combines an output's profile with its dataset's metadata"""
+        loader.save_dataset_metadata({"name": "sales", "category": "retail"}, "sales")
+        loader.save_file_profile({"rows": 1000}, "sales_2024", "sales")
+
+        metadata = loader.load_metadata("sales_2024")
+
+        assert metadata == {
+            "name": "sales",
+            "category": "retail",
+            "data_profile": {"rows": 1000},
+        }
+        assert "data_profile" not in loader.load_metadata("sales")
@@ -0,0 +1,173 @@
+"""
+Test suite for the staged ETL pipeline
+
+Tests:
+- CSV parsing reads missing values like pd.read_csv
+- Every CSV file of a dataset is read, transformed and written
+- Deployment sampling is applied before writing
+- Read and write failures fail the dataset and stop the stage threads
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from etl import pipeline as pipeline_module
+from etl.config import DatasetConfig, ETLConfig, SamplingConfig
+from etl.pipeline import ETLPipeline
+
+
+class FakeExtractor:
+    """Serves CSV files from the raw data directory instead of downloading them"""
+
+    def __init__(self, raw_data_dir):
+        self.raw_data_dir = raw_data_dir
+
+    def download_dataset(self, dataset_config):
+        return self.raw_data_dir / dataset_config.name
+
+    def extract_metadata(self, dataset_config):
+        return {"name": dataset_config.name, "category": dataset_config.project_category}
+
+    def get_dataset_files(self, dataset_dir):
+        return sorted(dataset_dir.glob("*.csv"))
+
+
+def make_dataset(name: str, sampling: SamplingConfig = None) -> DatasetConfig:
+    """Dataset config with placeholder Kaggle fields"""
+    return DatasetConfig(
+        name=name,
+        kaggle_id=f"owner/{name}",
+        description="test dataset",
+        project_category="test",
+        url="https://example.com",
+        sampling=sampling,
+    )
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch) -> ETLPipeline:
+    """Pipeline over a raw directory holding two CSV files for the 'sales' dataset"""
+    monkeypatch.setattr(pipeline_module, "KaggleExtractor", FakeExtractor)
+
+    raw_dir = tmp_path / "raw" / "sales"
+    raw_dir.mkdir(parents=True)
+    rng = np.random.default_rng(0)
+    for stem, rows in (("orders", 500), ("returns", 200)):
+        pd.DataFrame(
+            {
+                "Order ID": np.arange(rows),
+                "Amount": rng.normal(50, 5, rows).round(2),
+                "Region": rng.choice(["north", "south"], rows),
+            }
+        ).to_csv(raw_dir / f"{stem}.csv", index=False)
+
+    config = ETLConfig(
+        datasets=[],
+        raw_data_dir=tmp_path / "raw",
+        processed_data_dir=tmp_path / "processed",
+        metadata_dir=tmp_path / "metadata",
+        logs_dir=tmp_path / "logs",
+        max_workers=1,
+    )
+    return ETLPipeline(config)
+
+
+class TestReadCsv:
+    """Test ETLPipeline._read_csv"""
+
+    def test_missing_values_match_pandas(self, pipeline, tmp_path):
+        """Empty cells and NA markers are missing in string and numeric columns alike"""
+        csv_file = tmp_path / "stores.csv"
+        csv_file.write_text(
+            "store,city,region,sales\n"
+            "1,,north,10.5\n"
+            "2,,NA,NA\n"
+            "3,Leeds,None,\n"
+            "4,,south,n/a\n"
+        )
+        expected = pd.read_csv(csv_file)
+
+        result = pipeline._read_csv(csv_file)
+
+        assert result["city"].isna().sum() == 3
+        pd.testing.assert_series_equal(result.isna().sum(), expected.isna().sum())
+        pd.testing.assert_frame_equal(result.astype(expected.dtypes.to_dict()), expected)
+
+    def test_mostly_empty_string_column_dropped(self, pipeline, tmp_path):
+        """Missing strings count towards the transformer's >50% missing rule"""
+        csv_file = tmp_path / "stores.csv"
+        csv_file.write_text("store,city\n1,\n2,\n3,Leeds\n4,\n")
+
+        df = pipeline.transformer.transform_dataframe(pipeline._read_csv(csv_file), "stores")
+
+        assert list(df.columns) == ["store"]
+
+
+class TestProcessDataset:
+    """Test ETLPipeline.process_dataset"""
+
+    def test_all_files_written(self, pipeline):
+        """Each CSV becomes its own Parquet output and profile"""
+        result = pipeline.process_dataset(make_dataset("sales"))
+        loader = pipeline.loader
+
+        assert result["status"] == "success"
+        assert result["csv_files"] == ["orders.csv", "returns.csv"]
+        assert len(loader.load_parquet("sales_orders")) == 500
+        assert len(loader.load_parquet("sales_returns")) == 200
+        assert list(loader.load_parquet("sales_returns").columns) == [
+            "order_id",
+            "amount",
+            "region",
+        ]
+        assert loader.load_metadata("sales_orders")["data_profile"]["shape"]["rows"] == 500
+        assert loader.read_file_metadata("sales_orders") == {
+            "_dataset_name": "sales",
+            "_dataset_category": "test",
+        }
+
+    def test_sampling_applied(self, pipeline):
+        """Outputs are sampled down to max_rows"""
+        sampling = SamplingConfig(enabled=True, max_rows=100)
+
+        result = pipeline.process_dataset(make_dataset("sales", sampling))
+
+        assert result["status"] == "success"
+        assert len(pipeline.loader.load_parquet("sales_orders")) == 100
+        assert len(pipeline.loader.load_parquet("sales_returns")) == 100
+
+    def test_read_failure(self, pipeline, monkeypatch):
+        """A read error in the first stage fails the dataset"""
+        threads_before = threading.active_count()
+        read_csv = pipeline._read_csv
+
+        def failing_read(csv_file):
+            if csv_file.name == "returns.csv":
+                raise ValueError("unreadable")
+            return read_csv(csv_file)
+
+        monkeypatch.setattr(pipeline, "_read_csv", failing_read)
+
+        result = pipeline.process_dataset(make_dataset("sales"))
+
+        assert result["status"] == "failed"
+        assert result["error"] == "unreadable"
+        assert threading.active_count() == threads_before
+
+    def test_write_failure(self, pipeline, monkeypatch):
+        """A write error in the main thread stops the upstream stages"""
+        threads_before = threading.active_count()
+
+        def failing_save(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(pipeline.loader, "save_to_parquet", failing_save)
+
+        result = pipeline.process_dataset(make_dataset("sales"))
+
+        assert result["status"] == "failed"
+        assert result["error"] == "disk full"
+        assert threading.active_count() == threads_before
@@ -0,0 +1,160 @@
+"""
+Test suite for the ETL data sampler
+
+Tests:
+- Sampling configuration (disabled, already small enough)
+- Random sampling is deterministic and keeps row order
+- Stratified sampling keeps exact size and every stratum
+- Time series sampling keeps the requested size and temporal order
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from etl.config import SamplingConfig
+from etl.sampler import DataSampler
+
+
+def reference_time_series_sample(
+    df: pd.DataFrame, n_samples: int, time_column: str
+) -> pd.DataFrame:
+    """Sort-and-step sampling the time series strategy must reproduce"""
+    df_sorted = df.sort_values(time_column, kind="stable")
+    step = max(1, len(df_sorted) // n_samples)
+    return df_sorted.iloc[::step].head(n_samples)
+
+
+class TestSample:
+    """Test DataSampler.sample dispatch"""
+
+    @pytest.fixture
+    def df(self) -> pd.DataFrame:
+        """1000 rows in three groups"""
+        return pd.DataFrame({"value": np.arange(1000), "group": np.arange(1000) % 3})
+
+    def test_disabled_returns_input(self, df):
+        """No config, or a disabled one, returns the frame untouched"""
+        assert DataSampler.sample(df, None) is df
+        assert DataSampler.sample(df, SamplingConfig(enabled=False, max_rows=10)) is df
+
+    def test_small_frame_kept(self, df):
+        """Frames already within max_rows are not sampled"""
+        config = SamplingConfig(enabled=True, max_rows=1000)
+        assert DataSampler.sample(df, config) is df
+
+    def test_strategy_dispatch(self, df):
+        """Each strategy returns max_rows rows"""
+        for config in (
+            SamplingConfig(enabled=True, max_rows=100),
+            SamplingConfig(
+                enabled=True, max_rows=100, strategy="stratified", stratify_column="group"
+            ),
+            SamplingConfig(
+                enabled=True, max_rows=100, strategy="time_series", time_column="value"
+            ),
+        ):
+            assert len(DataSampler.sample(df, config)) == 100
+
+
+class TestRandomSample:
+    """Test DataSampler._random_sample"""
+
+    @pytest.fixture
+    def df(self) -> pd.DataFrame:
+        """10k rows with a non-default index"""
+        return pd.DataFrame({"value": np.arange(10_000)}, index=np.arange(10_000) * 2)
+
+    def test_deterministic_distinct_rows_in_order(self, df):
+        """Same rows on every call, no repeats, original order preserved"""
+        result = DataSampler._random_sample(df, 500)
+
+        assert len(result) == 500
+        assert result.index.is_unique
+        assert result.index.is_monotonic_increasing
+        assert result["value"].isin(df["value"]).all()
+        pd.testing.assert_frame_equal(result, DataSampler._random_sample(df, 500))
+
+    def test_more_samples_than_rows(self, df):
+        """Asking for more rows than exist returns every row"""
+        result = DataSampler._random_sample(df.head(10), 500)
+
+        pd.testing.assert_frame_equal(result, df.head(10))
+
+
+class TestStratifiedSample:
+    """Test DataSampler._stratified_sample"""
+
+    @pytest.fixture
+    def df(self) -> pd.DataFrame:
+        """Imbalanced strata: 9000 / 990 / 10 rows"""
+        labels = np.repeat(["common", "uncommon", "rare"], [9000, 990, 10])
+        return pd.DataFrame({"label": labels, "row": np.arange(len(labels))})
+
+    def test_exact_size_and_proportions(self, df):
+        """Sample size is exact and strata keep their proportions"""
+        result = DataSampler._stratified_sample(df, 1000, "label")
+        counts = result["label"].value_counts()
+
+        assert len(result) == 1000
+        assert result["row"].is_unique
+        assert counts["common"] == pytest.approx(900, abs=30)
+        assert counts["uncommon"] == pytest.approx(99, abs=30)
+        assert counts["rare"] >= 1
+
+    def test_every_stratum_represented(self, df):
+        """Small samples still contain each stratum once there is room"""
+        result = DataSampler._stratified_sample(df, 3, "label")
+
+        assert sorted(result["label"]) == ["common", "rare", "uncommon"]
+
+    def test_missing_column_falls_back_to_random(self, df):
+        """An unknown stratify column samples randomly instead"""
+        result = DataSampler._stratified_sample(df, 100, "missing")
+
+        pd.testing.assert_frame_equal(result, DataSampler._random_sample(df, 100))
+
+
+class TestTimeSeriesSample:
+    """Test DataSampler._time_series_sample"""
+
+    @pytest.fixture
+    def readings(self) -> pd.DataFrame:
+        """100k readings at 5-minute spacing"""
+        return pd.DataFrame(
+            {
+                "ts": pd.date_range("2024-01-01", periods=100_000, freq="5min"),
+                "value": np.arange(100_000),
+            }
+        )
+
+    def test_outlier_timestamp_keeps_sample_size(self, readings):
+        """A single far-off timestamp doesn't collapse the sample"""
+        readings.loc[500, "ts"] = pd.Timestamp("1900-01-01")
+
+        result = DataSampler._time_series_sample(readings, 1000, "ts")
+
+        assert len(result) == 1000
+        assert result["ts"].is_monotonic_increasing
+        pd.testing.assert_frame_equal(result, reference_time_series_sample(readings, 1000, "ts"))
+
+    def test_identical_timestamps_keep_sample_size(self, readings):
+        """All rows sharing one timestamp still yield n_samples rows"""
+        readings["ts"] = pd.Timestamp("2024-01-01")
+
+        result = DataSampler._time_series_sample(readings, 1000, "ts")
+
+        assert len(result) == 1000
+        pd.testing.assert_frame_equal(result, reference_time_series_sample(readings, 1000, "ts"))
+
+    @pytest.mark.parametrize("n_samples", [1, 7, 1000, 5000])
+    def test_matches_sort_and_step(self, n_samples):
+        """Unordered numeric times with missing values match sort-and-step sampling"""
+        rng = np.random.default_rng(0)
+        times = rng.normal(size=5000)
+        times[rng.choice(5000, size=50, replace=False)] = np.nan
+        df = pd.DataFrame({"t": times, "row": np.arange(5000)})
+
+        result = DataSampler._time_series_sample(df, n_samples, "t")
+
+        pd.testing.assert_frame_equal(result, reference_time_series_sample(df, n_samples, "t"))
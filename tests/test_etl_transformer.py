@@ -0,0 +1,144 @@
+"""
+Test suite for the ETL data transformer
+
+Tests:
+- Transformations leave the caller's dataframe untouched
+- Data profile statistics
+- Schema cache reuse and fallback
+- Duplicate detection matches pandas drop_duplicates
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from etl.transformer import DataTransformer
+
+
+class TestTransformDataframe:
+    """Test DataTransformer.transform_dataframe"""
+
+    @pytest.fixture
+    def raw_df(self) -> pd.DataFrame:
+        """Small raw frame exercising renaming, downcasting and deduplication"""
+        return pd.DataFrame(
+            {
+                "Customer ID": [1, 2, 2, 3],
+                "Amount ($)": [10.5, 20.0, 20.0, 30.25],
+                "Segment": ["a", "b", "b", "a"],
+            }
+        )
+
+    def test_input_frame_not_modified(self, raw_df):
+        """The caller's frame keeps its columns, dtypes and values"""
+        original = raw_df.copy(deep=True)
+
+        result = DataTransformer().transform_dataframe(raw_df, "test_dataset")
+
+        pd.testing.assert_frame_equal(raw_df, original)
+        assert list(result.columns) == ["customer_id", "amount_", "segment"]
+        assert len(result) == 3
+
+
+class TestDataProfile:
+    """Test DataTransformer.get_data_profile"""
+
+    def test_column_statistics(self):
+        """Numeric columns get statistics, all-null columns get None"""
+        df = pd.DataFrame(
+            {
+                "amount": [1.0, 2.0, None, 3.0],
+                "empty": [None, None, None, None],
+                "label": ["a", "b", "b", None],
+            }
+        ).astype({"empty": "float64"})
+
+        profile = DataTransformer().get_data_profile(df)
+        columns = profile["columns"]
+
+        assert profile["missing_values"] == {"amount": 1, "empty": 4, "label": 1}
+        assert columns["amount"]["mean"] == pytest.approx(2.0)
+        assert columns["amount"]["max"] == 3.0
+        assert columns["amount"]["missing_pct"] == 25.0
+        assert columns["empty"]["mean"] is None
+        assert columns["label"]["unique_count"] == 2
+        assert "mean" not in columns["label"]
+
+    def test_no_numeric_columns(self):
+        """All-text frames are profiled without numeric statistics"""
+        df = pd.DataFrame({"label": ["a", "b", None], "code": ["x", "x", "y"]})
+
+        profile = DataTransformer().get_data_profile(df)
+
+        assert profile["missing_values"] == {"label": 1, "code": 0}
+        assert profile["columns"]["code"]["unique_count"] == 2
+        assert "mean" not in profile["columns"]["label"]
+
+
+class TestSchemaCache:
+    """Test reuse of the inferred schema across runs"""
+
+    @pytest.fixture
+    def raw_df(self) -> pd.DataFrame:
+        """Frame whose dtypes are inferred from strings and narrowed integers"""
+        return pd.DataFrame(
+            {
+                "Order Date": ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"],
+                "Quantity": [1, 2, 3, 4],
+                "Region": ["north", "south", "north", "north"],
+                "Notes": [None, None, None, "late"],
+            }
+        )
+
+    def test_second_run_matches_inference(self, raw_df, tmp_path):
+        """The cached schema reproduces the dtypes and dropped columns of full inference"""
+        transformer = DataTransformer(schema_dir=tmp_path)
+
+        first = transformer.transform_dataframe(raw_df, "orders")
+        assert (tmp_path / "orders_schema.json").exists()
+
+        second = transformer.transform_dataframe(raw_df, "orders")
+        pd.testing.assert_frame_equal(first, second)
+        assert "notes" not in second.columns
+
+    def test_falls_back_when_values_overflow(self, raw_df, tmp_path):
+        """Values outside a cached narrowed integer type trigger re-inference"""
+        transformer = DataTransformer(schema_dir=tmp_path)
+        transformer.transform_dataframe(raw_df, "orders")
+
+        wider = raw_df.assign(Quantity=[1, 2, 3, 100_000])
+        result = transformer.transform_dataframe(wider, "orders")
+
+        assert result["quantity"].max() == 100_000
+
+
+class TestFirstOccurrences:
+    """Test DataTransformer._first_occurrences against pandas duplicate semantics"""
+
+    def test_signed_zeros_are_duplicates(self):
+        """-0.0 and 0.0 compare equal, as in drop_duplicates"""
+        df = pd.DataFrame({"value": [0.0, -0.0, 1.0, -0.0], "label": ["a", "a", "b", "a"]})
+
+        result = df.iloc[DataTransformer._first_occurrences(df)]
+
+        pd.testing.assert_frame_equal(result, df.drop_duplicates())
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_drop_duplicates_on_mixed_dtypes(self, seed):
+        """Random frames with floats, nulls, strings, categoricals and datetimes"""
+        rng = np.random.default_rng(seed)
+        n = 500
+        df = pd.DataFrame(
+            {
+                "float": rng.choice([0.0, -0.0, np.nan, 1.5], n),
+                "int": rng.integers(0, 3, n),
+                "text": rng.choice(["a", "b", None], n),
+                "category": pd.Categorical(rng.choice(["x", "y"], n), categories=["x", "y", "z"]),
+                "flag": rng.choice([True, False], n),
+                "date": pd.to_datetime(rng.choice(["2024-01-01", "2024-01-02", None], n)),
+            }
+        )
+
+        result = df.iloc[DataTransformer._first_occurrences(df)]
+
+        pd.testing.assert_frame_equal(result, df.drop_duplicates())
@@ -0,0 +1,191 @@
+"""
+Test suite for the v1.2 -> v1.3 migration script
+
+Tests:
+- Common formatting is extracted into default_formatting
+- Round-trip and PyYAML writers produce the same document
+- Files without common formatting only get their version line bumped
+- Formatting plans are saved, reused and refreshed
+- Missing input files are filtered out
+"""
+
+import json
+import sys
+
+import pytest
+import yaml
+
+import migrate_to_v13
+from migrate_to_v13 import existing_paths, migrate_yaml, migrate_yaml_captured
+
+SPEC = """\
+dsl_version: "1.2.0"
+# Sales dashboard
+dashboard:
+  id: sales
+  data_source:
+    type: parquet
+    path: data/sales.parquet
+    formatting:
+      revenue: {type: currency, currency: GBP}
+      units: {type: number, precision: 0}
+      margin: {type: number, precision: 2}
+      orders: {type: number, precision: 0}
+      visits: {type: number, precision: 0}
+    column_labels:
+      revenue: Revenue
+"""
+
+SPEC_WITHOUT_FORMATTING = """\
+dsl_version: '1.2.0'   # keep this comment
+dashboard:
+  data_source:
+    path: data/sales.parquet
+"""
+
+
+def data_source(path):
+    """Parsed data_source block of a migrated file"""
+    return yaml.safe_load(path.read_text())["dashboard"]["data_source"]
+
+
+@pytest.fixture
+def spec_file(tmp_path):
+    """v1.2 spec with four fields sharing number formatting"""
+    path = tmp_path / "sales.yaml"
+    path.write_text(SPEC)
+    return path
+
+
+class TestMigrateYaml:
+    """Test migrate_yaml"""
+
+    def test_default_formatting_extracted(self, spec_file):
+        """Shared properties move to default_formatting, overrides stay per field"""
+        assert migrate_yaml(spec_file) is True
+
+        content = yaml.safe_load(spec_file.read_text())
+        source = content["dashboard"]["data_source"]
+
+        assert content["dsl_version"] == "1.3.0"
+        assert list(source) == [
+            "type",
+            "path",
+            "default_formatting",
+            "formatting",
+            "column_labels",
+        ]
+        assert source["default_formatting"] == {"type": "number", "precision": 0}
+        assert source["formatting"] == {
+            "revenue": {"type": "currency", "currency": "GBP"},
+            "margin": {"precision": 2},
+        }
+
+    @pytest.mark.skipif(migrate_to_v13.YAML is None, reason="ruamel.yaml not installed")
+    def test_round_trip_keeps_comments(self, spec_file):
+        """The round-trip writer keeps comments and quoting"""
+        migrate_yaml(spec_file)
+        text = spec_file.read_text()
+
+        assert text.startswith('dsl_version: "1.3.0"\n# Sales dashboard\n')
+
+    def test_writers_agree(self, spec_file, tmp_path, monkeypatch):
+        """PyYAML and round-trip writers produce the same keys, order and values"""
+        pyyaml_file = tmp_path / "pyyaml.yaml"
+        pyyaml_file.write_text(SPEC)
+
+        migrate_yaml(spec_file)
+        monkeypatch.setattr(migrate_to_v13, "YAML", None)
+        migrate_yaml(pyyaml_file)
+
+        assert yaml.safe_load(spec_file.read_text()) == yaml.safe_load(pyyaml_file.read_text())
+        assert list(data_source(spec_file)) == list(data_source(pyyaml_file))
+
+    def test_existing_default_formatting_replaced_in_place(self, spec_file):
+        """An existing default_formatting key is replaced, still ahead of formatting"""
+        existing = "    default_formatting: {precision: 1}\n    formatting:"
+        spec_file.write_text(SPEC.replace("    formatting:", existing))
+
+        migrate_yaml(spec_file)
+        source = data_source(spec_file)
+
+        assert list(source) == ["type", "path", "default_formatting", "formatting", "column_labels"]
+        assert source["default_formatting"] == {"type": "number", "precision": 0}
+
+    def test_version_bump_only(self, tmp_path):
+        """Without formatting, only the version line is rewritten"""
+        path = tmp_path / "plain.yaml"
+        path.write_text(SPEC_WITHOUT_FORMATTING)
+
+        assert migrate_yaml(path) is True
+        assert path.read_text() == SPEC_WITHOUT_FORMATTING.replace("1.2.0", "1.3.0")
+
+    def test_other_versions_skipped(self, spec_file):
+        """Files not at 1.2.0 are left untouched"""
+        spec_file.write_text(SPEC.replace("1.2.0", "1.1.0"))
+
+        assert migrate_yaml(spec_file) is False
+        assert spec_file.read_text() == SPEC.replace("1.2.0", "1.1.0")
+
+    def test_dry_run_writes_nothing(self, spec_file):
+        """Dry runs report changes without writing"""
+        assert migrate_yaml(spec_file, dry_run=True) is True
+        assert spec_file.read_text() == SPEC
+
+
+class TestPlan:
+    """Test reuse of formatting plans"""
+
+    def test_plan_reused_for_unchanged_file(self, spec_file, tmp_path, monkeypatch):
+        """A plan entry with a matching digest skips the analysis"""
+        changed, output, entry = migrate_yaml_captured(spec_file, dry_run=True)
+        assert changed and "Would migrate" in output
+        assert entry["default_format"] == {"type": "number", "precision": 0}
+
+        def fail(*args):
+            raise AssertionError("formatting re-analysed")
+
+        monkeypatch.setattr(migrate_to_v13, "analyze_formatting", fail)
+        copy = tmp_path / "copy.yaml"
+        copy.write_text(SPEC)
+
+        migrate_yaml_captured(copy, plan_entry=entry)
+
+        assert data_source(copy)["default_formatting"] == entry["default_format"]
+
+    def test_stale_plan_refreshed(self, spec_file):
+        """A digest mismatch re-analyses the file and updates the entry"""
+        stale = {"digest": "0" * 40, "default_format": {"precision": 5}}
+
+        _, _, entry = migrate_yaml_captured(spec_file, plan_entry=stale, dry_run=True)
+
+        assert entry["digest"] != stale["digest"]
+        assert entry["default_format"] == {"type": "number", "precision": 0}
+
+    def test_main_saves_plan(self, spec_file, tmp_path, monkeypatch, capsys):
+        """--output-plan writes entries keyed by resolved path, in the format load_plan reads"""
+        plan_path = tmp_path / "plan.json"
+        missing = tmp_path / "missing.yaml"
+
+        monkeypatch.setattr(
+            sys, "argv", ["migrate", str(spec_file), str(missing), "--output-plan", str(plan_path)]
+        )
+        migrate_to_v13.main()
+
+        plan = json.loads(plan_path.read_text())
+        assert [entry["path"] for entry in plan] == [str(spec_file.resolve())]
+        assert "File not found" in capsys.readouterr().out
+        assert migrate_to_v13.load_plan(str(plan_path)) == {plan[0]["path"]: plan[0]}
+
+
+class TestExistingPaths:
+    """Test existing_paths"""
+
+    def test_missing_files_dropped(self, tmp_path):
+        """Only existing files are kept, in input order"""
+        present = tmp_path / "a.yaml"
+        present.touch()
+
+        paths = [tmp_path / "b.yaml", present, tmp_path / "missing" / "c.yaml"]
+
+        assert existing_paths(paths) == [present]
@@ -0,0 +1,84 @@
+"""
+Test suite for the Streamlit renderer helpers
+
+Tests:
+- Grid components are packed into rows of twelfths
+- Select filter options come from the values present in the data
+"""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from dsl.renderers.streamlit.renderer import GRID_COLUMNS, StreamlitRenderer, _filter_options
+
+
+def widths(rows):
+    """Row layout as lists of declared widths"""
+    return [[component["width"] for component, _ in row] for row in rows]
+
+
+class TestPackGridRows:
+    """Test StreamlitRenderer._pack_grid_rows"""
+
+    def test_adjacent_halves_share_a_row(self):
+        """Two halves fill one row; a full-width component gets its own"""
+        components = [{"width": "half"}, {"width": "half"}, {"width": "full"}]
+
+        rows = StreamlitRenderer._pack_grid_rows(components)
+
+        assert widths(rows) == [["half", "half"], ["full"]]
+        assert [[w for _, w in row] for row in rows] == [[6, 6], [12]]
+
+    def test_overflow_starts_new_row(self):
+        """A component that doesn't fit the remaining width wraps"""
+        components = [
+            {"width": "third"},
+            {"width": "half"},
+            {"width": "half"},
+            {"width": "third"},
+            {"width": "third"},
+            {"width": "third"},
+        ]
+
+        rows = StreamlitRenderer._pack_grid_rows(components)
+
+        assert widths(rows) == [["third", "half"], ["half", "third"], ["third", "third"]]
+        assert all(sum(w for _, w in row) <= GRID_COLUMNS for row in rows)
+
+    def test_order_preserved_and_default_full(self):
+        """Components keep their order; missing or unknown widths are full rows"""
+        components = [{"id": 1}, {"id": 2, "width": "wide"}, {"id": 3, "width": "half"}]
+
+        rows = StreamlitRenderer._pack_grid_rows(components)
+
+        assert [[c["id"] for c, _ in row] for row in rows] == [[1], [2], [3]]
+        assert StreamlitRenderer._pack_grid_rows([]) == []
+
+
+class TestFilterOptions:
+    """Test _filter_options"""
+
+    @pytest.fixture
+    def data_path(self, tmp_path):
+        """Parquet file with a categorical column holding an unused category"""
+        df = pd.DataFrame(
+            {
+                "region": pd.Categorical(
+                    ["north", "south", None, "north"], categories=["east", "north", "south"]
+                ),
+                "product": ["b", "a", None, "b"],
+            }
+        )
+        path = tmp_path / "sales.parquet"
+        pq.write_table(pa.Table.from_pandas(df), path, row_group_size=2)
+        return str(path)
+
+    def test_unused_categories_excluded(self, data_path):
+        """Dictionary-encoded columns only offer categories present in the rows"""
+        assert _filter_options(data_path, 0, "region") == ["north", "south"]
+
+    def test_plain_column(self, data_path):
+        """Other columns offer their sorted distinct non-null values"""
+        assert _filter_options(data_path, 0, "product") == ["a", "b"]